@@ -25,10 +25,19 @@ import time
 import traceback
 import subprocess
 import hashlib
+import mmap
+import sqlite3
+import atexit
+import copy
+import re
+import functools
+import itertools
+import heapq
 from datetime import datetime
 from pathlib import Path
 import threading
 import queue
+import collections
 import webbrowser
 
 # ---- High DPI (Windows)
@@ -56,6 +65,13 @@ try:
 except Exception:
     EXIFREAD_OK = False
 
+# ---- Fast content hashing (optional)
+try:
+    import xxhash  # type: ignore
+    XXHASH_OK = True
+except Exception:
+    XXHASH_OK = False
+
 APP_NAME = "sd_to_c_sort"
 DEFAULT_DEST = r"D:\\pics\\2025-1"
 
@@ -63,22 +79,38 @@ CONFIG_DIR = Path(os.getenv("APPDATA") or Path.home() / ".config") / APP_NAME
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = CONFIG_DIR / "run.log"
 STATE_FILE = CONFIG_DIR / "state.json"
+HASH_CACHE = CONFIG_DIR / "hashes.sqlite"
 
-IMAGE_EXT = {
+# frozenset: immutable, slightly faster membership tests on the hot path
+IMAGE_EXT = frozenset({
     ".jpg", ".jpeg", ".png", ".heic", ".heif", ".tif", ".tiff",
     ".arw", ".cr2", ".cr3", ".nef", ".orf", ".rw2", ".raf", ".dng", ".srw", ".pef"
-}
-PROC_EXT = {".jpg", ".jpeg", ".heic", ".heif", ".png"}
-RAW_EXT = {
+})
+PROC_EXT = frozenset({".jpg", ".jpeg", ".heic", ".heif", ".png"})
+RAW_EXT = frozenset({
     ".arw", ".cr2", ".cr3", ".nef", ".orf", ".rw2", ".raf", ".dng", ".srw", ".pef", ".tif", ".tiff"
-}
+})
+# Extension → file-kind classification in a single dict lookup
+KIND_MAP = {e: "raw" for e in RAW_EXT} | {e: "jpg" for e in PROC_EXT}
+
+
+# Memoized parse of state.json: several UI paths call read_state() per user
+# action, so reparse only when the file actually changed on disk.
+_STATE_CACHE: dict | None = None
+_STATE_MTIME = 0
 
 
 def read_state() -> dict:
     """Read the state file and return default settings."""
+    global _STATE_CACHE, _STATE_MTIME
     try:
         if STATE_FILE.exists():
-            return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+            mtime = STATE_FILE.stat().st_mtime_ns
+            if _STATE_CACHE is None or mtime != _STATE_MTIME:
+                _STATE_CACHE = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+                _STATE_MTIME = mtime
+            # Copy so callers can mutate their dict without corrupting the cache
+            return copy.deepcopy(_STATE_CACHE)
     except Exception:
         pass
     # Return default configuration with new options included
@@ -93,33 +125,112 @@ def read_state() -> dict:
         "action": "copy",  # copy | move
         "skip_hash_dup": False,  # skip if content hash duplicates
         "max_workers": 1,  # number of concurrent processing threads (1=sequential)
+        "cas_mode": False,  # store blobs once under .cas/ and hardlink into place
     }
 
 
 def write_state(data: dict) -> None:
     """Save configuration state to the file."""
+    global _STATE_CACHE, _STATE_MTIME
     try:
         STATE_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        _STATE_CACHE = copy.deepcopy(data)
+        _STATE_MTIME = STATE_FILE.stat().st_mtime_ns
     except Exception:
         pass
 
 
+class _LogWriter(threading.Thread):
+    """
+    Background log writer.
+
+    Keeps a single handle to ``run.log`` open and drains queued lines in
+    batches, instead of paying an open/write/close syscall round-trip for
+    every message during a bulk sort.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True, name="log-writer")
+        self._q: queue.Queue = queue.Queue()
+        self._stopping = threading.Event()
+
+    def write(self, line: str) -> None:
+        self._q.put(line)
+
+    def stop(self) -> None:
+        """Signal shutdown and wait briefly for the queue to drain."""
+        self._stopping.set()
+        self.join(timeout=2)
+
+    def run(self) -> None:
+        try:
+            f = open(LOG_FILE, "a", encoding="utf-8")
+        except Exception:
+            return
+        with f:
+            while not (self._stopping.is_set() and self._q.empty()):
+                try:
+                    msgs = [self._q.get(timeout=0.2)]
+                except queue.Empty:
+                    continue
+                # Drain whatever else is queued so one write covers the batch
+                while True:
+                    try:
+                        msgs.append(self._q.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    f.writelines(msgs)
+                    f.flush()
+                except Exception:
+                    pass
+
+
+_LOG_WRITER: _LogWriter | None = None
+
+
 def log_write(msg: str) -> None:
     """Append a string to the log file."""
+    global _LOG_WRITER
     try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {msg}\n")
+        if _LOG_WRITER is None:
+            _LOG_WRITER = _LogWriter()
+            _LOG_WRITER.start()
+            atexit.register(_LOG_WRITER.stop)
+        _LOG_WRITER.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {msg}\n")
     except Exception:
         pass
 
 
 def walk_images(root: Path):
-    """Traverse all image files under the root folder."""
-    for dp, _, fns in os.walk(root):
-        for fn in fns:
-            p = Path(dp) / fn
-            if p.suffix.lower() in IMAGE_EXT:
-                yield p
+    """
+    Traverse all image files under the root folder, yielding path strings.
+
+    Uses an explicit os.scandir() stack instead of os.walk so no Path object
+    is allocated per directory entry; the consumer converts only the paths it
+    actually keeps.
+    """
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                        elif e.is_file(follow_symlinks=False):
+                            # Try the raw suffix first; extensions are
+                            # usually lowercase already, so .lower() (one
+                            # string allocation per file) is the rare path
+                            fn = e.name
+                            ext = fn[fn.rfind("."):]
+                            if ext in IMAGE_EXT or ext.lower() in IMAGE_EXT:
+                                yield e.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
 
 
 def human(n: int) -> str:
@@ -127,37 +238,140 @@ def human(n: int) -> str:
     return f"{n / 1_000_000:.1f}M" if n >= 1_000_000 else (f"{n / 1_000:.1f}k" if n >= 1_000 else str(n))
 
 
+# Resolved once at import: a PATH walk per file adds up on large scans
+EXIFTOOL_PATH = shutil.which("exiftool")
+
+
 def which_exiftool() -> str | None:
     """Return the path to the exiftool executable if available, otherwise None."""
-    return shutil.which("exiftool")
+    return EXIFTOOL_PATH
+
+
+# Disallowed filename characters, replaced with spaces in one C-level pass
+_SANITIZE_RE = re.compile(r"[^\w .\-()+\[\]#/]+")
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize(name: str) -> str:
     """Sanitize a string so it is safe for use as a folder or file name."""
     if not name:
         return "Unknown"
-    safe_chars = []
-    for ch in name.strip():
-        if ch.isalnum() or ch in " ._-()+[]#/":
-            safe_chars.append(ch)
-        else:
-            safe_chars.append(" ")
-    s = " ".join("".join(safe_chars).split())
+    # Camera/lens strings repeat across thousands of files, hence the cache
+    s = " ".join(_SANITIZE_RE.sub(" ", name.strip()).split())
     trimmed = s[:120] if len(s) > 120 else s
     return trimmed or "Unknown"
 
 
+# Matches both EXIF ("2025:08:24 10:11:12") and ISO-style dates; any trailing
+# timezone suffix is ignored, as the result is naive anyway
+_DT_RE = re.compile(r"(\d{4})[:\-](\d{2})[:\-](\d{2})[ T](\d{2}):(\d{2}):(\d{2})")
+
+
+@functools.lru_cache(maxsize=8192)
 def parse_dt_str(s: str) -> datetime | None:
     """Convert an EXIF date string into a :class:`datetime` object."""
-    s = s.strip()
-    for fmt in ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y:%m:%d %H:%M:%S%z", "%Y-%m-%d %H:%M:%S%z"):
-        try:
-            dt = datetime.strptime(s, fmt)
-            # Remove timezone information if present
-            return dt.replace(tzinfo=None)
-        except Exception:
-            continue
-    return None
+    m = _DT_RE.match(s.strip())
+    if not m:
+        return None
+    try:
+        # Direct construction avoids strptime's per-call format machinery
+        return datetime(int(m[1]), int(m[2]), int(m[3]), int(m[4]), int(m[5]), int(m[6]))
+    except ValueError:
+        # Out-of-range fields (e.g. "0000:00:00 00:00:00" placeholders)
+        return None
+
+
+# EXIF tag ids used by the APP1 fast path
+_TAG_MODEL = 0x0110
+_TAG_DATETIME = 0x0132
+_TAG_EXIF_IFD = 0x8769
+_TAG_DATETIME_ORIG = 0x9003
+_TAG_LENS_MODEL = 0xA434
+
+
+def exif_from_jpeg_head(path: Path):
+    """
+    Extract date, camera and lens by scanning the JPEG APP1 segment directly.
+
+    Reads only the first 64 KB and walks the TIFF IFDs by hand — no image
+    decoder is initialised, which makes this an order of magnitude cheaper
+    than a full Pillow open for large JPEGs. Returns (None, None, None) for
+    anything it cannot parse; callers fall through to the other strategies.
+    """
+    try:
+        with open(path, "rb") as f:
+            buf = f.read(65536)
+    except Exception:
+        return None, None, None
+    if len(buf) < 12 or buf[0:2] != b"\xff\xd8":
+        return None, None, None
+    # Locate the APP1 (Exif) marker segment
+    tiff = b""
+    i = 2
+    while i + 4 <= len(buf):
+        if buf[i] != 0xFF:
+            break
+        marker = buf[i + 1]
+        seglen = int.from_bytes(buf[i + 2:i + 4], "big")
+        if marker == 0xE1 and buf[i + 4:i + 10] == b"Exif\x00\x00":
+            tiff = buf[i + 10:i + 2 + seglen]
+            break
+        if marker == 0xDA:  # start of scan — EXIF always precedes image data
+            break
+        i += 2 + seglen
+    if len(tiff) < 8:
+        return None, None, None
+    if tiff[0:2] == b"II":
+        bo = "little"
+    elif tiff[0:2] == b"MM":
+        bo = "big"
+    else:
+        return None, None, None
+
+    def u16(o: int) -> int:
+        return int.from_bytes(tiff[o:o + 2], bo)
+
+    def u32(o: int) -> int:
+        return int.from_bytes(tiff[o:o + 4], bo)
+
+    def read_ifd(off: int, want: frozenset) -> tuple[dict, int]:
+        """Collect ASCII values for *want* tags; returns (values, exif_ifd_offset)."""
+        vals: dict[int, str] = {}
+        exif_off = 0
+        if off <= 0 or off + 2 > len(tiff):
+            return vals, exif_off
+        count = u16(off)
+        for k in range(count):
+            e = off + 2 + 12 * k
+            if e + 12 > len(tiff):
+                break
+            tag = u16(e)
+            typ = u16(e + 2)
+            n = u32(e + 4)
+            if tag == _TAG_EXIF_IFD:
+                exif_off = u32(e + 8)
+            elif tag in want and typ == 2 and n:  # type 2 = ASCII
+                vo = e + 8 if n <= 4 else u32(e + 8)
+                raw = tiff[vo:vo + n]
+                s = raw.split(b"\x00", 1)[0].decode("ascii", "ignore").strip()
+                if s:
+                    vals[tag] = s
+        return vals, exif_off
+
+    try:
+        vals, exif_off = read_ifd(u32(4), frozenset({_TAG_MODEL, _TAG_DATETIME}))
+        if exif_off:
+            sub, _ = read_ifd(exif_off, frozenset({_TAG_DATETIME_ORIG, _TAG_LENS_MODEL}))
+            vals.update(sub)
+    except Exception:
+        return None, None, None
+    dto = None
+    for tag in (_TAG_DATETIME_ORIG, _TAG_DATETIME):
+        if tag in vals:
+            dto = parse_dt_str(vals[tag])
+            if dto:
+                break
+    return dto, vals.get(_TAG_MODEL), vals.get(_TAG_LENS_MODEL)
 
 
 def exif_from_pillow(path: Path):
@@ -211,16 +425,94 @@ def exif_from_exifread(path: Path):
         return None, None, None
 
 
-def exif_from_exiftool(path: Path):
-    """Extract EXIF metadata using the external ``exiftool`` executable."""
+# Fields requested from exiftool for every file
+_EXIFTOOL_ARGS = ["-json", "-S", "-Model", "-Make", "-LensModel", "-Lens", "-DateTimeOriginal"]
+
+
+class ExifToolWorker:
+    """
+    A long-lived ``exiftool -stay_open`` subprocess.
+
+    Spawning exiftool once per file costs tens of milliseconds of process
+    startup each; batch mode keeps one process alive and streams paths to it
+    via the ``-@ -`` argfile protocol, reading results up to the ``{ready}``
+    sentinel.
+    """
+
+    def __init__(self, exe: str) -> None:
+        self._exe = exe
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [self._exe, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def get(self, path: Path) -> dict:
+        """Return the metadata dict for one file (empty dict on failure)."""
+        with self._lock:
+            proc = self._ensure()
+            cmd = "\n".join(_EXIFTOOL_ARGS + [str(path), "-execute"]) + "\n"
+            proc.stdin.write(cmd.encode("utf-8"))  # type: ignore
+            proc.stdin.flush()  # type: ignore
+            out = bytearray()
+            while True:
+                line = proc.stdout.readline()  # type: ignore
+                if not line:
+                    raise RuntimeError("exiftool worker terminated")
+                if line.strip() == b"{ready}":
+                    break
+                out += line
+            data = json.loads(out.decode("utf-8", errors="ignore")) if out.strip() else []
+            return data[0] if data else {}
+
+    def stop(self) -> None:
+        try:
+            if self._proc is not None and self._proc.poll() is None:
+                self._proc.stdin.write(b"-stay_open\nFalse\n")  # type: ignore
+                self._proc.stdin.flush()  # type: ignore
+                self._proc.wait(timeout=2)
+        except Exception:
+            try:
+                self._proc.kill()  # type: ignore
+            except Exception:
+                pass
+
+
+# One worker per process (each process-pool worker lazily starts its own)
+_EXIFTOOL_WORKER: ExifToolWorker | None = None
+
+
+def _exiftool_worker() -> ExifToolWorker | None:
+    global _EXIFTOOL_WORKER
     exe = which_exiftool()
     if not exe:
+        return None
+    if _EXIFTOOL_WORKER is None:
+        _EXIFTOOL_WORKER = ExifToolWorker(exe)
+        atexit.register(_EXIFTOOL_WORKER.stop)
+    return _EXIFTOOL_WORKER
+
+
+def exif_from_exiftool(path: Path):
+    """Extract EXIF metadata using the external ``exiftool`` executable."""
+    worker = _exiftool_worker()
+    if worker is None:
         return None, None, None
     try:
-        # Call exiftool to extract only essential fields (model, make, lens, date)
-        cmd = [exe, "-json", "-S", "-Model", "-Make", "-LensModel", "-Lens", "-DateTimeOriginal", str(path)]
-        out = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
-        data = json.loads(out.decode("utf-8", errors="ignore"))[0] if out else {}
+        try:
+            data = worker.get(path)
+        except Exception:
+            # Batch worker failed (e.g. killed); one-shot invocation fallback
+            cmd = [worker._exe] + _EXIFTOOL_ARGS + [str(path)]
+            out = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
+            data = json.loads(out.decode("utf-8", errors="ignore"))[0] if out else {}
         dto = None
         if "DateTimeOriginal" in data:
             dto = parse_dt_str(str(data.get("DateTimeOriginal")))
@@ -234,6 +526,11 @@ def exif_from_exiftool(path: Path):
         return None, None, None
 
 
+# Metadata results keyed by (path, mtime_ns, size): a preview followed by a
+# rescan of the same unchanged files skips all EXIF work on the second pass.
+_META_CACHE: dict[tuple, dict] = {}
+
+
 def extract_meta(path: Path) -> dict:
     """
     Extract date, camera, lens and file type information from the given file.
@@ -242,50 +539,65 @@ def extract_meta(path: Path) -> dict:
     in as much metadata as possible. Falls back to the file modification time
     if no EXIF date is found.
     """
+    cache_key = None
+    try:
+        st = path.stat()
+        cache_key = (str(path), st.st_mtime_ns, st.st_size)
+        cached = _META_CACHE.get(cache_key)
+        if cached is not None:
+            # Shallow copy so per-run annotations don't leak into the cache
+            return dict(cached)
+    except Exception:
+        pass
     dto = cam = lens = None
-    # pillow
-    d1, c1, l1 = exif_from_pillow(path)
-    if d1:
-        dto = d1
-    if c1:
-        cam = c1
-    if l1:
-        lens = l1
-    # exifread
-    d2, c2, l2 = exif_from_exifread(path)
-    if not dto and d2:
-        dto = d2
-    if not cam and c2:
-        cam = c2
-    if not lens and l2:
-        lens = l2
-    # exiftool
-    d3, c3, l3 = exif_from_exiftool(path)
-    if not dto and d3:
-        dto = d3
-    if not cam and c3:
-        cam = c3
-    if not lens and l3:
-        lens = l3
+    # Fast path: raw APP1 scan for JPEGs, one 64 KB read and no decoder setup
+    if path.suffix.lower() in (".jpg", ".jpeg"):
+        dto, cam, lens = exif_from_jpeg_head(path)
+    # Stop as soon as every field is filled: the remaining strategies are
+    # strictly fallbacks, and exiftool in particular spawns a subprocess.
+    if not (dto and cam and lens):
+        # pillow
+        d1, c1, l1 = exif_from_pillow(path)
+        if not dto and d1:
+            dto = d1
+        if not cam and c1:
+            cam = c1
+        if not lens and l1:
+            lens = l1
+    if not (dto and cam and lens):
+        # exifread
+        d2, c2, l2 = exif_from_exifread(path)
+        if not dto and d2:
+            dto = d2
+        if not cam and c2:
+            cam = c2
+        if not lens and l2:
+            lens = l2
+    if not (dto and cam and lens):
+        # exiftool
+        d3, c3, l3 = exif_from_exiftool(path)
+        if not dto and d3:
+            dto = d3
+        if not cam and c3:
+            cam = c3
+        if not lens and l3:
+            lens = l3
     # fallback
     if dto is None:
         try:
             dto = datetime.fromtimestamp(path.stat().st_mtime)
         except Exception:
             dto = datetime.now()
-    year = f"{dto:%Y}"
-    month = f"{dto:%Y-%m}"
-    date = f"{dto:%Y-%m-%d}"
+    # Integer formatting beats strftime for these fixed patterns, and the
+    # month/date strings build on each other instead of reformatting
+    y, mo, da = dto.year, dto.month, dto.day
+    year = f"{y:04d}"
+    month = f"{year}-{mo:02d}"
+    date = f"{month}-{da:02d}"
     cam = sanitize(cam or "Unknown Camera")
     lens = sanitize(lens or "Unknown Lens")
-    ext = path.suffix.lower()
-    if ext in RAW_EXT:
-        kind = "raw"
-    elif ext in PROC_EXT:
-        kind = "jpg"
-    else:
-        kind = "other"
-    return {
+    kind = KIND_MAP.get(path.suffix.lower(), "other")
+    meta = {
         "path": path,
         "dt": dto,
         "year": year,
@@ -295,11 +607,299 @@ def extract_meta(path: Path) -> dict:
         "lens": lens,
         "kind": kind,
     }
+    if cache_key is not None:
+        _META_CACHE[cache_key] = dict(meta)
+    return meta
+
+
+@functools.lru_cache(maxsize=2048)
+def _dir_for_key(dest_root: str, group: str, year: str, month: str, date: str, hier: str, kind: str | None) -> Path:
+    """Assemble (and memoize) the folder Path for one group/date combination.
+
+    Thousands of files collapse onto a handful of folders, so caching by the
+    folder key skips the repeated Path joins for all but the first file of
+    each folder.
+    """
+    base = Path(dest_root)
+    # Build a three-level folder structure: year/month/date
+    if hier == "device-first":
+        base = base / group / year / month / date
+    else:
+        base = base / year / month / date / group
+    if kind is not None:
+        base = base / kind
+    return base
+
+
+def plan_dir(meta: dict, group_by: str, hier: str, split: bool, dest_root: Path) -> Path:
+    """Build the destination directory for one meta from snapshotted options.
+
+    Taking the options as plain arguments lets hot loops read each Tk
+    variable once per run instead of once per file (every .get() is a round
+    trip into the Tcl interpreter).
+    """
+    group = sanitize(meta["camera"] if group_by == "camera" else meta["lens"])
+    return _dir_for_key(
+        str(dest_root), group, meta["year"], meta["month"], meta["date"],
+        hier, meta["kind"] if split else None,
+    )
+
+
+def extract_meta_batch(paths: list) -> tuple:
+    """Extract metadata for a batch of files and pre-aggregate the counts.
+
+    Returns (metas, camera Counter, lens Counter, date set). Handing workers
+    whole batches instead of single files amortizes the per-task scheduling
+    cost, and aggregating inside the worker means the caller merges a handful
+    of Counters instead of incrementing dicts once per file.
+    """
+    metas = [extract_meta(p) for p in paths]
+    cam_counts = collections.Counter(m["camera"] for m in metas)
+    len_counts = collections.Counter(m["lens"] for m in metas)
+    dates = {m["date"] for m in metas}
+    return metas, cam_counts, len_counts, dates
+
+
+# In-memory hash caches keyed by (path, size, mtime_ns) so a preview→sort
+# cycle never hashes the same unchanged file twice.
+_HEAD_HASH_CACHE: dict[tuple, str] = {}
+_FULL_HASH_CACHE: dict[tuple, str] = {}
+
+# Persistent full-hash cache: re-runs over the same destination tree skip
+# re-reading gigabytes of unchanged data. Entries record the hash algorithm
+# so a cache written with xxhash is not misread by a SHA-1 fallback run.
+_hash_db_conn = None
+_hash_db_pending = 0
+
+
+def _hash_db():
+    global _hash_db_conn
+    if _hash_db_conn is None:
+        conn = sqlite3.connect(str(HASH_CACHE), check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+            "alg TEXT, digest TEXT)"
+        )
+        conn.commit()
+        _hash_db_conn = conn
+    return _hash_db_conn
+
+
+def _hash_db_get(key: tuple) -> str | None:
+    try:
+        row = _hash_db().execute(
+            "SELECT digest FROM hashes WHERE path=? AND size=? AND mtime_ns=? AND alg=?",
+            (key[0], key[1], key[2], HASH_ALG),
+        ).fetchone()
+        return row[0] if row else None
+    except Exception:
+        return None
+
+
+def _hash_db_put(key: tuple, digest: str) -> None:
+    global _hash_db_pending
+    try:
+        _hash_db().execute(
+            "INSERT OR REPLACE INTO hashes (path, size, mtime_ns, alg, digest) VALUES (?,?,?,?,?)",
+            (key[0], key[1], key[2], HASH_ALG, digest),
+        )
+        # Commit in batches during bulk sorts; atexit flushes the remainder.
+        _hash_db_pending += 1
+        if _hash_db_pending >= 64:
+            _hash_db().commit()
+            _hash_db_pending = 0
+    except Exception:
+        pass
+
+
+def _hash_db_flush() -> None:
+    try:
+        if _hash_db_conn is not None:
+            _hash_db_conn.commit()
+    except Exception:
+        pass
+
+
+atexit.register(_hash_db_flush)
+
+
+def _hash_cache_key(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+        return (str(path), st.st_size, st.st_mtime_ns)
+    except Exception:
+        return None
+
+
+def file_head_hash(path: Path, n: int = 65536) -> str:
+    """Hash the first and last *n* bytes of a file (fast difference detector).
+
+    The head covers the EXIF/thumbnail blocks where images almost always
+    differ; the tail catches truncated or appended-to copies that share an
+    identical header. Both come from one open, so the quick tier still costs
+    at most two small reads.
+    """
+    h = _new_hasher()
+    try:
+        with open(path, "rb") as f:
+            h.update(f.read(n))
+            size = os.fstat(f.fileno()).st_size
+            if size > n:
+                f.seek(max(n, size - n))
+                h.update(f.read(n))
+        return h.hexdigest()
+    except Exception:
+        return ""
+
+
+def _cached_hash(path: Path, cache: dict, fn) -> str:
+    key = _hash_cache_key(path)
+    if key is None:
+        return fn(path)
+    digest = cache.get(key)
+    if digest is None:
+        digest = fn(path)
+        if digest:
+            cache[key] = digest
+    return digest
+
+
+def cached_file_hash(path: Path) -> str:
+    """Full-file hash backed by the in-memory and on-disk caches."""
+    key = _hash_cache_key(path)
+    if key is None:
+        return file_hash(path)
+    digest = _FULL_HASH_CACHE.get(key)
+    if digest is None:
+        digest = _hash_db_get(key)
+        if digest is None:
+            digest = file_hash(path)
+            if digest:
+                _hash_db_put(key, digest)
+        if digest:
+            _FULL_HASH_CACHE[key] = digest
+    return digest
+
+
+def same_content(src: Path, dst: Path) -> bool:
+    """
+    Return True if two files have identical content.
+
+    Uses a tiered comparison: file sizes first (different sizes can never be
+    duplicates), then a hash of the first and last 64 KiB — covering the EXIF
+    and thumbnail blocks where images almost always differ — and only if both
+    tiers match, the full content hash.
+    """
+    try:
+        if src.stat().st_size != dst.stat().st_size:
+            return False
+    except Exception:
+        return False
+    h1 = _cached_hash(src, _HEAD_HASH_CACHE, file_head_hash)
+    if not h1 or h1 != _cached_hash(dst, _HEAD_HASH_CACHE, file_head_hash):
+        return False
+    h1 = cached_file_hash(src)
+    return bool(h1) and h1 == cached_file_hash(dst)
+
+
+def batch_warm_hashes(pairs: list[tuple[Path, Path]], max_workers: int | None = None) -> None:
+    """
+    Pre-compute content comparisons for many (src, dst) pairs concurrently.
+
+    Hashing lots of small-to-medium files is dominated by per-file I/O
+    latency, not CPU, so keeping several reads in flight lets the kernel
+    overlap them. Results land in the hash caches, making the later
+    per-file checks during the sort effectively free.
+    """
+    if not pairs:
+        return
+    import concurrent.futures
+    workers = max_workers or min(8, (os.cpu_count() or 1) * 2)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            for _ in ex.map(lambda p: same_content(p[0], p[1]), pairs):
+                pass
+    except Exception:
+        pass
+
+
+def cas_store(src: Path, dst: Path, cas_root: Path) -> None:
+    """
+    Copy *src* into the content-addressable store and hardlink it at *dst*.
+
+    Identical content imported repeatedly (re-read cards, merged libraries)
+    is stored once under ``cas_root/<digest[:2]>/<digest>``; every
+    user-visible location is a hardlink to that blob. The blob path is
+    derived from the digest, so no separate index is needed. Raises OSError
+    when hashing or linking fails so callers can fall back to a plain copy.
+    """
+    digest = cached_file_hash(src)
+    if not digest:
+        raise OSError(f"could not hash {src}")
+    cas_path = cas_root / digest[:2] / digest
+    if not cas_path.exists():
+        cas_path.parent.mkdir(parents=True, exist_ok=True)
+        fast_copy(src, cas_path)
+    os.link(cas_path, dst)
+
+
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """Copy a file's content and metadata using the platform fast path."""
+    if _HAS_COPY_FILE_RANGE:
+        # copy_file_range moves data kernel-to-kernel (no user-space buffer)
+        # and a 1 GiB request lets big RAW files go in one or two syscalls
+        try:
+            with open(src, "rb") as fin, open(dst, "wb") as fout:
+                infd, outfd = fin.fileno(), fout.fileno()
+                while os.copy_file_range(infd, outfd, 1 << 30):
+                    pass
+            try:
+                shutil.copystat(src, dst)
+            except Exception:
+                pass
+            return
+        except OSError:
+            # Cross-device ranges or filesystems without support (EXDEV/
+            # ENOSYS/EINVAL): fall through to the generic path
+            pass
+    # copyfile uses sendfile/fcopyfile/CopyFile2 under the hood on 3.8+,
+    # avoiding the user-space buffer loop of plain copy2
+    shutil.copyfile(src, dst)
+    try:
+        shutil.copystat(src, dst)
+    except Exception:
+        pass
+
+
+def same_device(src: Path, dst_dir: Path) -> bool:
+    """Return True if src and the destination directory share a filesystem."""
+    try:
+        return os.stat(src).st_dev == os.stat(dst_dir).st_dev
+    except Exception:
+        return False
+
 
+def unique_dest(dest_dir: Path, name: str, existing: set[str] | None = None) -> Path:
+    """
+    Generate a destination file path that will not collide with existing files.
 
-def unique_dest(dest_dir: Path, name: str) -> Path:
-    """Generate a destination file path that will not collide with existing files."""
+    When *existing* (the set of file names already present in ``dest_dir``) is
+    given, candidates are probed in memory instead of issuing one stat syscall
+    per attempt, and the chosen name is reserved in the set.
+    """
     base, ext = os.path.splitext(name)
+    if existing is not None:
+        cand_name = name
+        i = 1
+        while cand_name in existing:
+            cand_name = f"{base}_{i}{ext}"
+            i += 1
+        existing.add(cand_name)
+        return dest_dir / cand_name
     cand = dest_dir / name
     i = 1
     while cand.exists():
@@ -308,17 +908,46 @@ def unique_dest(dest_dir: Path, name: str) -> Path:
     return cand
 
 
+# Duplicate detection only needs a fast, well-distributed digest, not a
+# cryptographic one; xxh3 is several times faster than SHA-1 on large RAW files.
+HASH_ALG = "xxh3_64" if XXHASH_OK else "sha1"
+
+
+def _new_hasher():
+    """Return a hash object for duplicate-content detection."""
+    return xxhash.xxh3_64() if XXHASH_OK else hashlib.sha1()
+
+
+# Files at or above this size are hashed through an mmap instead of chunked
+# reads, avoiding per-chunk Python buffer allocation on large RAW frames.
+MMAP_HASH_THRESHOLD = 10 << 20
+
+
 def file_hash(path: Path, chunk_size: int = 1 << 20) -> str:
-    """Compute the SHA‑1 hash of a file (reads in chunks for efficiency)."""
-    sha1 = hashlib.sha1()
+    """Compute the content hash of a file (reads in chunks for efficiency)."""
+    h = _new_hasher()
     try:
         with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= MMAP_HASH_THRESHOLD:
+                try:
+                    # Hash straight out of the page cache; one update call
+                    # covers the whole file with no intermediate buffers.
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        h.update(mm)
+                    return h.hexdigest()
+                except Exception:
+                    # mmap can fail on network shares etc.; fall back to reads
+                    f.seek(0)
+            elif size <= chunk_size:
+                h.update(f.read())
+                return h.hexdigest()
             while True:
                 data = f.read(chunk_size)
                 if not data:
                     break
-                sha1.update(data)
-        return sha1.hexdigest()
+                h.update(data)
+        return h.hexdigest()
     except Exception:
         return ""
 
@@ -365,6 +994,18 @@ PALETTE = {
     },
 }
 
+# Initial treeview column widths (pixels); _apply_pane_widths recomputes the
+# window-dependent ones later, so these are just the build-time defaults
+COL_DEFAULTS = {
+    "preview_#0": 520,
+    "preview_count": 120,
+    "cam_#0": 300,
+    "cam_cnt": 60,
+    "len_#0": 300,
+    "len_cnt": 60,
+    "conf_dst": 1000,
+}
+
 # Translation dictionary
 # Defines messages in English (en) and Korean (ko) for use in program summaries and dialogs.
 TR_MSG: dict[str, dict[str, str]] = {
@@ -436,6 +1077,7 @@ TR_MSG: dict[str, dict[str, str]] = {
     "not_selected": {"en": "(none)", "ko": "(미선택)"},
     "preview_tree": {"en": "Planned Top Folders (Preview)", "ko": "생성될 상위 폴더(미리보기)"},
     "file_count": {"en": "File Count", "ko": "파일 수"},
+    "preview_placeholder": {"en": "Scan a folder to see the preview here.", "ko": "폴더를 스캔하면 여기에 미리보기가 표시됩니다."},
     # Distribution summary
     "dist_summary": {"en": "Distribution Summary", "ko": "분포 요약"},
     "camera": {"en": "Camera", "ko": "카메라"},
@@ -446,6 +1088,7 @@ TR_MSG: dict[str, dict[str, str]] = {
     "existing_path": {"en": "Existing Destination Path", "ko": "이미 존재하는 대상 경로"},
     # Progress information
     "idle": {"en": "Idle", "ko": "대기 중"},
+    "scan_progress": {"en": "Scanning… {n} files", "ko": "스캔 중… {n}개 파일"},
     # Settings window
     "settings_title": {"en": "Settings", "ko": "설정"},
     "dest_change_title": {"en": "Destination folder for copy/move", "ko": "복사/이동 대상 폴더"},
@@ -490,8 +1133,25 @@ TR_MSG: dict[str, dict[str, str]] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _tr_lookup(key: str, lang: str) -> str:
+    """Look up a translation, falling back to Korean for unknown languages.
+
+    Memoized: TR_MSG is immutable at runtime and the UI resolves the same
+    (key, language) pairs on every rebuild/language pass.
+    """
+    return TR_MSG.get(key, {}).get(lang, TR_MSG[key]["ko"])
+
+
+@functools.lru_cache(maxsize=None)
 def font_stack(size: int = 12, weight: str = "normal") -> ctk.CTkFont:
-    """Select a font from the available system font stack."""
+    """
+    Select a font from the available system font stack.
+
+    Memoized: the UI requests the same handful of (size, weight) pairs for
+    hundreds of widgets, and Tk dedupes identical named fonts, so one CTkFont
+    per combination serves every caller.
+    """
     candidates = ["SF Pro Text", "SF Pro Display", "Segoe UI", "Helvetica", "Arial"]
     for name in candidates:
         try:
@@ -524,8 +1184,18 @@ class PhotoSorterApp(ctk.CTk):
         self.metas: list[dict] = []
         self.plan: dict[Path, list[Path]] = {}
         self.conflicts: list[tuple[Path, Path]] = []
+        # File names already present per target directory (one scan per dir
+        # instead of one stat per file)
+        self._existing: dict[Path, set[str]] = {}
         self.stop_flag = threading.Event()
-        self.ui_queue: queue.Queue = queue.Queue()
+        # deque appends are atomic under the GIL — no mutex traffic per
+        # message; the Event just flags that the drain pass has work
+        self.ui_queue: collections.deque = collections.deque()
+        self._ui_dirty = threading.Event()
+        # Overwrite slot for the newest progress payload plus a bounded log
+        # batch; both are swapped out wholesale by _drain_ui_queue
+        self._latest_status: dict | None = None
+        self._log_batch: collections.deque = collections.deque(maxlen=256)
         # UI binding variables
         self.policy_var = ctk.StringVar(value=self.state_data.get("policy", "ask"))
         self.group_by_var = ctk.StringVar(value=self.state_data.get("group_by", "camera"))
@@ -537,11 +1207,40 @@ class PhotoSorterApp(ctk.CTk):
         self.workers_var = ctk.IntVar(value=max(1, int(self.state_data.get("max_workers", 1))))
         # Initialize the list of widgets targeted for translation (before building the UI)
         self._lang_widgets: list[tuple[object, str]] = []
+        # Screen size is effectively constant; query it once instead of a
+        # Tcl round-trip per layout pass. Window width is tracked from
+        # <Configure> events rather than polled via winfo_width().
+        self._sw, self._sh = self.winfo_screenwidth(), self.winfo_screenheight()
+        self._cur_w = 0
+        # Last geometry string issued via self.geometry()
+        self._last_geom = ""
+        # Settings dialog is built once and then shown/hidden (see _open_settings)
+        self._settings_dlg = None
+        self._settings_dlg_lang = ""
+        # Debounce state for <Configure> resize handling
+        self._resize_after_id: str | None = None
+        # Debounce state for the settings scale slider
+        self._scale_after_id: str | None = None
+        # Deferred state persistence (see _mark_state_dirty)
+        self._state_dirty = False
+        self._state_flush_id: str | None = None
+        self._last_adjust_width = -1
+        self._last_conf_w = -1
+        self._last_preview_w = -1
+        # Current palette dict, cached so build/theme code doesn't re-query
+        # the appearance mode (a Tcl round-trip) per widget
+        self._pal = PALETTE.get(self.state_data.get("appearance", "light"), PALETTE["light"])
+        # Palette last pushed to the widgets (None until _apply_palette runs)
+        self._applied_pal = None
+        self._styled_once = False
+        # The preview panes (cards + trees) are built lazily on the first scan
+        self._preview_built = False
 
         # Build the UI
         self._build_appbar()
         self._build_body()
-        self._style_treeviews()
+        self._style_treeviews_static()
+        self._style_treeviews_palette()
         self._apply_palette()
         # UI update schedule
         self.after(80, self._drain_ui_queue)
@@ -549,6 +1248,8 @@ class PhotoSorterApp(ctk.CTk):
         self.after(200, lambda: self._adjust_layout(force=True))
         # Adjust column widths when the window size changes
         self.bind("<Configure>", self._on_resize)
+        # Make sure any pending state save lands before the window goes away
+        self.bind("<Destroy>", self._on_destroy)
 
         # Language configuration
         # If 'language' is missing from state_data, open the language selection dialog.
@@ -568,7 +1269,7 @@ class PhotoSorterApp(ctk.CTk):
     # 번역 메시지를 가져오는 도우미
     def _t_msg(self, key: str) -> str:
         try:
-            return TR_MSG.get(key, {}).get(self.language, TR_MSG[key]["ko"])
+            return _tr_lookup(key, self.language)
         except Exception:
             return key
 
@@ -578,10 +1279,13 @@ class PhotoSorterApp(ctk.CTk):
 
     def _update_ui_language(self) -> None:
         """Update the text of registered widgets according to the current language."""
+        # Translate each distinct key once, then fan out to the widgets; many
+        # widgets share a key, so this trims the lookups to the unique set
+        tmap = {key: self._t_msg(key) for _, key in self._lang_widgets}
         for widget, key in self._lang_widgets:
             try:
                 # Some widgets can have their text set via configure
-                widget.configure(text=self._t_msg(key))
+                widget.configure(text=tmap[key])
             except Exception:
                 try:
                 # Treeview headings are updated separately
@@ -666,7 +1370,7 @@ class PhotoSorterApp(ctk.CTk):
         # Save the selected language and immediately apply it to the UI
             self.language = lang
             self.state_data["language"] = lang
-            write_state(self.state_data)
+            self._mark_state_dirty()
             dlg.destroy()
             # UI 텍스트 갱신
             self._update_ui_language()
@@ -721,7 +1425,7 @@ class PhotoSorterApp(ctk.CTk):
         """
         try:
             # Calculate screen dimensions and scaling
-            sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
+            sw, sh = self._sw, self._sh
             base_w, base_h = 1220, 800
             scale = float(self.state_data.get("scale", 1.0))
             target_w = int(base_w * scale)
@@ -733,116 +1437,156 @@ class PhotoSorterApp(ctk.CTk):
                 # Center the window on the screen
                 x = max(0, (sw - w) // 2)
                 y = max(0, (sh - h) // 2)
-                self.geometry(f"{w}x{h}+{x}+{y}")
+                g = f"{w}x{h}+{x}+{y}"
+                # geometry() is a heavy Tk op; the settings-save after-cascade
+                # re-runs this path with unchanged inputs, so only issue it
+                # when the target actually differs
+                if g != self._last_geom:
+                    self.geometry(g)
+                    self._last_geom = g
             # Calculate available width for the right pane (left panel is fixed at 360)
-            current_width = self.winfo_width() or w
-            right_available = current_width - 360 - 18 - 12 - 16 - 16  # subtract padding, margins etc.
-            if right_available > 0:
-                conf_width = max(400, int(right_available * 0.7))
-                try:
-                    self.tree_conf.column("dst", width=conf_width)
-                except Exception:
-                    pass
-                preview_width = max(300, int(right_available * 0.6))
-                try:
-                    self.tree_preview.column("#0", width=preview_width)
-                except Exception:
-                    pass
+            current_width = self._cur_w or w
+            self._apply_pane_widths(current_width)
         except Exception:
             pass
 
+    def _apply_pane_widths(self, current_width: int) -> None:
+        """Compute tree column widths and apply only the ones that changed."""
+        # The trees exist from the first scan onward; before that there is
+        # nothing to size (and no need for try/except around each write)
+        if not self._preview_built:
+            return
+        right_available = current_width - 360 - 18 - 12 - 16 - 16  # subtract padding, margins etc.
+        if right_available <= 0:
+            return
+        # Each column(width=...) call triggers a full Treeview relayout, so
+        # skip the Tcl call entirely when the computed value is unchanged
+        conf_width = max(400, int(right_available * 0.7))
+        if conf_width != self._last_conf_w:
+            self.tree_conf.column("dst", width=conf_width)
+            self._last_conf_w = conf_width
+        preview_width = max(300, int(right_available * 0.6))
+        if preview_width != self._last_preview_w:
+            self.tree_preview.column("#0", width=preview_width)
+            self._last_preview_w = preview_width
+
     def _adjust_columns(self) -> None:
         """Adjust treeview column widths based on the current window width."""
         try:
-            current_width = self.winfo_width()
+            current_width = self._cur_w
             if not current_width:
                 return
-            right_available = current_width - 360 - 18 - 12 - 16 - 16
-            if right_available > 0:
-                conf_width = max(400, int(right_available * 0.7))
-                try:
-                    self.tree_conf.column("dst", width=conf_width)
-                except Exception:
-                    pass
-                preview_width = max(300, int(right_available * 0.6))
-                try:
-                    self.tree_preview.column("#0", width=preview_width)
-                except Exception:
-                    pass
+            # No-op <Configure> events (focus changes, child reconfigures)
+            # arrive at an unchanged width, and sub-4px jitter from window
+            # managers isn't worth a column rewrite — hysteresis filters both
+            if abs(current_width - self._last_adjust_width) < 4:
+                return
+            self._last_adjust_width = current_width
+            self._apply_pane_widths(current_width)
         except Exception:
             pass
 
     def _on_resize(self, event=None) -> None:
-        """Adjust column widths when the window size changes."""
+        """Adjust column widths when the window size changes (debounced)."""
+        # A <Configure> binding on a toplevel also fires for child widgets;
+        # only the toplevel's own width matters here
+        if event is not None and event.widget is not self:
+            return
+        self._cur_w = event.width if event is not None else self._cur_w
+        # Tk fires dozens of <Configure> events per second during a drag;
+        # coalesce them so only the last one in a burst touches the trees
+        if self._resize_after_id is not None:
+            try:
+                self.after_cancel(self._resize_after_id)
+            except Exception:
+                pass
+        self._resize_after_id = self.after(50, self._do_deferred_resize)
+
+    def _do_deferred_resize(self) -> None:
+        self._resize_after_id = None
         self._adjust_columns()
 
     # ----- Styling -----
+    # Maps a palette role to the widget option it recolors
+    _ROLE_ATTR = {"elev": "fg_color", "subtle": "fg_color", "text": "text_color", "text_sub": "text_color"}
+
+    def _palette_targets(self):
+        """Yield (widget, role) pairs for everything the palette recolors."""
+        for w in getattr(self, "_themed_frames", []):
+            yield w, "elev"
+        for w in getattr(self, "_subtle_frames", []):
+            yield w, "subtle"
+        for w in (getattr(self, "_appbar", None), getattr(self, "_footer", None)):
+            if w is not None:
+                yield w, "elev"
+        for w in getattr(self, "_title_labels", []):
+            yield w, "text"
+        for w in getattr(self, "_sub_labels", []):
+            yield w, "text_sub"
+
     def _apply_palette(self) -> None:
         mode = ctk.get_appearance_mode().lower()  # type: ignore
         pal = PALETTE.get(mode, PALETTE["light"])
+        # Writing an unchanged color to every widget is pure Tcl overhead;
+        # skip the walk entirely when the palette is the one already applied
+        if pal is self._applied_pal:
+            return
+        self._applied_pal = pal
+        self._pal = pal
         self.configure(fg_color=pal["bg"])
-        for w in getattr(self, "_themed_frames", []):
-            try:
-                w.configure(fg_color=pal["elev"])
-            except Exception:
-                pass
-        for w in getattr(self, "_subtle_frames", []):
-            try:
-                w.configure(fg_color=pal["subtle"])
-            except Exception:
-                pass
+        # Single pass dispatching by role instead of one loop per widget list.
+        # A per-widget try/except would cost a frame + traceback on every
+        # destroyed widget; winfo_exists is a cheap Tcl boolean instead
+        attr_for = self._ROLE_ATTR
         try:
-            self._appbar.configure(fg_color=pal["elev"])
-            self._footer.configure(fg_color=pal["elev"])
+            for w, role in self._palette_targets():
+                if w.winfo_exists():
+                    w.configure(**{attr_for[role]: pal[role]})
         except Exception:
             pass
-        for lbl in getattr(self, "_title_labels", []):
-            try:
-                lbl.configure(text_color=pal["text"])
-            except Exception:
-                pass
-        for lbl in getattr(self, "_sub_labels", []):
-            try:
-                lbl.configure(text_color=pal["text_sub"])
-            except Exception:
-                pass
 
-    def _style_treeviews(self) -> None:
+    def _style_treeviews_static(self) -> None:
+        """One-time tree styling: theme, fonts, row height, style assignment.
+
+        Nothing here depends on the palette, so theme toggles never need to
+        re-run it (see _style_treeviews_palette for the color-bearing part).
+        """
         style = ttk.Style()
         try:
             style.theme_use("clam")
         except Exception:
             pass
-        style.configure(
-            "Treeview.Heading",
-            font=("Segoe UI", 10, "bold"),
-            relief="flat",
-            background="#E6E6EA",
-            foreground="#222",
-        )
+        style.configure("Treeview.Heading", font=("Segoe UI", 10, "bold"), relief="flat")
         style.map("Treeview.Heading", relief=[("active", "flat")])
+        style.configure("Apple.Treeview", rowheight=28, font=("Segoe UI", 10))
+        style.map(
+            "Apple.Treeview",
+            background=[("selected", "#D3E7FF")],
+            foreground=[("selected", "#000000")],
+            highlightthickness=[("!focus", 0)],
+        )
+        # The style name never changes, so assign it to the trees only once
+        if self._preview_built and not self._styled_once:
+            for tv in (self.tree_preview, self.tree_conf, self.tree_cam, self.tree_len):
+                tv.configure(style="Apple.Treeview")
+            self._styled_once = True
+
+    def _style_treeviews_palette(self) -> None:
+        """Refresh only the color-bearing style options (run on theme toggle)."""
+        style = ttk.Style()
+        style.configure("Treeview.Heading", background="#E6E6EA", foreground="#222")
         style.configure(
             "Apple.Treeview",
-            rowheight=28,
-            font=("Segoe UI", 10),
             background="#FAFAFC",
             fieldbackground="#FAFAFC",
             bordercolor="#DDDEE3",
             lightcolor="#DDDEE3",
             darkcolor="#DDDEE3",
         )
-        style.map(
-            "Apple.Treeview",
-            background=[("selected", "#D3E7FF")],
-            foreground=[("selected", "#000000")],
-            highlightthickness=[("!focus", 0)],
-        )
-        for tv in (self.tree_preview, self.tree_conf, self.tree_cam, self.tree_len):
-            tv.configure(style="Apple.Treeview")
 
     # ----- UI Build -----
     def _build_appbar(self) -> None:
-        pal = PALETTE[self.state_data.get("appearance", "light")]
+        pal = self._pal
         bar = ctk.CTkFrame(self, height=64, corner_radius=0, fg_color=pal["elev"])
         bar.grid(row=0, column=0, sticky="ew")
         bar.grid_columnconfigure(0, weight=1)
@@ -882,12 +1626,13 @@ class PhotoSorterApp(ctk.CTk):
         )
         self.btn_donate.grid(row=0, column=2, pady=10)
         self._register_lang(self.btn_donate, "donate_link")
-        sep = ctk.CTkFrame(self, height=1, corner_radius=0, fg_color=("#E8E8EA", "#2A2A2A"))
-        sep.grid(row=0, column=0, sticky="ew", pady=(63, 0))
+        # The hairline under the bar is drawn by its own border rather than a
+        # dedicated 1px frame — one less widget for layout and palette passes.
+        # CTk color tuples handle the light/dark variants automatically.
+        bar.configure(border_width=1, border_color=("#E8E8EA", "#2A2A2A"))
 
     def _build_body(self) -> None:
-        mode = self.state_data.get("appearance", "light")
-        pal = PALETTE[mode]
+        pal = self._pal
         # Create the main interface as a scrollable frame so that it can scroll vertically
         body = ctk.CTkScrollableFrame(self, corner_radius=16, fg_color=pal["bg"], orientation="vertical")
         # Configure the grid layout inside the scroll frame to place widgets
@@ -898,6 +1643,11 @@ class PhotoSorterApp(ctk.CTk):
         left = ctk.CTkFrame(body, width=360, corner_radius=16, fg_color=pal["elev"])
         left.grid(row=0, column=0, rowspan=2, sticky="nsw", padx=(16, 12), pady=16)
         left.grid_propagate(False)
+        # Children below are packed one by one; without this, every pack()
+        # makes Tk re-solve the whole layout. Propagation is restored in one
+        # shot once the build finishes (see _finalize_layout).
+        left.pack_propagate(False)
+        self._left = left
         self._themed_frames = [left]
         self._subtle_frames = []
         self._title_labels = []
@@ -913,7 +1663,7 @@ class PhotoSorterApp(ctk.CTk):
         self.btn_scan = ctk.CTkButton(left, text=self._t_msg("btn_scan"), command=self.scan_preview, height=42, state="disabled")
         self.btn_start = ctk.CTkButton(left, text=self._t_msg("btn_start"), command=self.start_sort, height=46, state="disabled")
         # The stop button uses the danger color from the palette
-        self.btn_stop = ctk.CTkButton(left, text=self._t_msg("btn_stop"), command=self.request_stop, fg_color=PALETTE[self.state_data.get("appearance", "light")]["danger"], hover_color=None, height=36, state="disabled")
+        self.btn_stop = ctk.CTkButton(left, text=self._t_msg("btn_stop"), command=self.request_stop, fg_color=pal["danger"], hover_color=None, height=36, state="disabled")
         # Register each button for language updates
         for key, btn in [("btn_pick", self.btn_pick), ("btn_scan", self.btn_scan), ("btn_start", self.btn_start), ("btn_stop", self.btn_stop)]:
             self._register_lang(btn, key)
@@ -961,22 +1711,16 @@ class PhotoSorterApp(ctk.CTk):
         self.lbl_group_title = ctk.CTkLabel(opt, text=self._t_msg("group_title"), font=font_stack(13, "bold"))
         self.lbl_group_title.pack(anchor="w", padx=12, pady=(10, 4))
         self._register_lang(self.lbl_group_title, "group_title")
-        gb = ctk.CTkSegmentedButton(opt, values=["camera", "lens"])
-        gb.set(self.group_by_var.get())
+        # variable= keeps the widget and the StringVar in sync both ways, so
+        # no manual _sync closure is needed
+        gb = ctk.CTkSegmentedButton(opt, values=["camera", "lens"], variable=self.group_by_var)
         gb.pack(fill="x", padx=12)
-        def _sync_gb(_=None):
-            self.group_by_var.set(gb.get())
-        gb._command = _sync_gb  # type: ignore
         # Folder hierarchy
         self.lbl_hier_title = ctk.CTkLabel(opt, text=self._t_msg("hier_title"), font=font_stack(13, "bold"))
         self.lbl_hier_title.pack(anchor="w", padx=12, pady=(12, 4))
         self._register_lang(self.lbl_hier_title, "hier_title")
-        hb = ctk.CTkSegmentedButton(opt, values=["device-first", "date-first"])
-        hb.set(self.hier_var.get())
+        hb = ctk.CTkSegmentedButton(opt, values=["device-first", "date-first"], variable=self.hier_var)
         hb.pack(fill="x", padx=12)
-        def _sync_hb(_=None):
-            self.hier_var.set(hb.get())
-        hb._command = _sync_hb  # type: ignore
         # RAW separation switch
         row_opt = ctk.CTkFrame(opt, fg_color="transparent")
         row_opt.pack(fill="x", padx=12, pady=(10, 10))
@@ -987,12 +1731,8 @@ class PhotoSorterApp(ctk.CTk):
         self.lbl_action_title = ctk.CTkLabel(opt, text=self._t_msg("action_title"), font=font_stack(13, "bold"))
         self.lbl_action_title.pack(anchor="w", padx=12, pady=(6, 4))
         self._register_lang(self.lbl_action_title, "action_title")
-        act = ctk.CTkSegmentedButton(opt, values=["copy", "move"])
-        act.set(self.action_var.get())
+        act = ctk.CTkSegmentedButton(opt, values=["copy", "move"], variable=self.action_var)
         act.pack(fill="x", padx=12)
-        def _sync_act(_=None):
-            self.action_var.set(act.get())
-        act._command = _sync_act  # type: ignore
         # Hash duplication switch
         self.sw_hash = ctk.CTkSwitch(opt, text=self._t_msg("hash_skip"), variable=self.skip_hash_var, onvalue=True, offvalue=False)
         self.sw_hash.pack(anchor="w", padx=12, pady=(8, 12))
@@ -1008,18 +1748,66 @@ class PhotoSorterApp(ctk.CTk):
         self.log_text.pack(fill="both", expand=True, padx=12, pady=(0, 12))
         # Write a ready message in the selected language
         self._append_log(self._t_msg("ready"))
-        # Right-hand area
+        # Right-hand area: only the shell is built at startup; the summary
+        # cards and the four treeviews are created on the first scan, which
+        # keeps cold start light (ttk Treeviews are not free) and shrinks
+        # the widget set every palette/style pass has to walk until then.
         right = ctk.CTkFrame(body, corner_radius=16, fg_color=pal["elev"])
         right.grid(row=0, column=1, sticky="nsew", padx=(12, 16), pady=(16, 12))
         right.grid_columnconfigure(0, weight=1)
-        # Assign row weights so that each section expands proportionally to the window size
-        right.grid_rowconfigure(1, weight=2)  # The preview occupies more space due to its higher weight
-        right.grid_rowconfigure(2, weight=1)  # Distribution summary
-        right.grid_rowconfigure(3, weight=1)  # Duplicate list
         self._themed_frames.append(right)
+        self._right = right
+        # Display selected folder
+        self.lbl_sd_path = ctk.CTkLabel(right, text=f"{self._t_msg('selected_folder')}: {self._t_msg('not_selected')}", anchor="w", font=font_stack(12))
+        self.lbl_sd_path.grid(row=0, column=0, sticky="ew", padx=28, pady=(16, 4))
+        # Placeholder shown until the first scan replaces it with the panes
+        right.grid_rowconfigure(1, weight=1)
+        self.lbl_preview_placeholder = ctk.CTkLabel(right, text=self._t_msg("preview_placeholder"), font=font_stack(14))
+        self.lbl_preview_placeholder.grid(row=1, column=0, padx=16, pady=16)
+        self._sub_labels.append(self.lbl_preview_placeholder)
+        self._register_lang(self.lbl_preview_placeholder, "preview_placeholder")
+        # Progress bar and information
+        footer = ctk.CTkFrame(self, corner_radius=0, fg_color=pal["elev"])
+        footer.grid(row=2, column=0, sticky="ew")
+        footer.grid_columnconfigure(0, weight=1)
+        self._footer = footer
+        self.progress = ctk.CTkProgressBar(footer, height=16)
+        self.progress.set(0)
+        self.progress.grid(row=0, column=0, sticky="ew", padx=20, pady=(10, 4))
+        self.progress_info = ctk.CTkLabel(footer, text=self._t_msg("idle"), font=font_stack(12))
+        self._register_lang(self.progress_info, "idle")
+        self.progress_info.grid(row=1, column=0, sticky="w", padx=20, pady=(0, 12))
+        # One deferred geometry solve for everything built above
+        self.after_idle(self._finalize_layout)
+
+    def _finalize_layout(self) -> None:
+        """Re-enable geometry propagation suppressed during the build."""
+        try:
+            self._left.pack_propagate(True)
+        except Exception:
+            pass
+
+    def _build_preview_panes(self) -> None:
+        """Build the summary cards and treeviews (deferred to the first scan)."""
+        pal = self._pal
+        right = self._right
+        try:
+            # Drop the placeholder from the iteration lists too, so the
+            # palette/language passes never see a dead widget
+            ph = self.lbl_preview_placeholder
+            self._sub_labels.remove(ph)
+            self._lang_widgets = [(w, k) for w, k in self._lang_widgets if w is not ph]
+            ph.destroy()
+        except Exception:
+            pass
+        # Assign row weights so that each section expands proportionally to the window size
+        right.grid_rowconfigure(1, weight=0)  # Row 1 stretched for the placeholder; the cards row must not
+        right.grid_rowconfigure(2, weight=2)  # The preview occupies more space due to its higher weight
+        right.grid_rowconfigure(3, weight=1)  # Distribution summary
+        right.grid_rowconfigure(4, weight=1)  # Duplicate list
         # Summary cards
         cards = ctk.CTkFrame(right, fg_color=pal["elev"])
-        cards.grid(row=0, column=0, sticky="ew", padx=16, pady=(16, 10))
+        cards.grid(row=1, column=0, sticky="ew", padx=16, pady=(16, 10))
         cards.grid_columnconfigure((0, 1, 2, 3, 4), weight=1)
         self.card_total = self._metric_card(cards, self._t_msg("total_images"), "0")
         self.card_total.grid(row=0, column=0, sticky="ew", padx=(0, 8))
@@ -1033,26 +1821,27 @@ class PhotoSorterApp(ctk.CTk):
         self.card_len.grid(row=0, column=4, sticky="ew", padx=(8, 0))
         # Preview area
         preview = ctk.CTkFrame(right, corner_radius=12, fg_color=pal["elev"])
-        preview.grid(row=1, column=0, sticky="nsew", padx=16, pady=(0, 12))
+        preview.grid(row=2, column=0, sticky="nsew", padx=16, pady=(0, 12))
         preview.grid_columnconfigure(0, weight=1)
-        preview.grid_rowconfigure(1, weight=1)
+        preview.grid_rowconfigure(0, weight=1)
+        # Suppress per-child relayouts while the trees are gridded in;
+        # propagation is restored in one pass at the end of this method
+        preview.grid_propagate(False)
         self._themed_frames.append(preview)
-        # Display selected folder
-        self.lbl_sd_path = ctk.CTkLabel(preview, text=f"{self._t_msg('selected_folder')}: {self._t_msg('not_selected')}", anchor="w", font=font_stack(12))
-        self.lbl_sd_path.grid(row=0, column=0, sticky="ew", padx=12, pady=(12, 4))
         # Do not specify height so the row expands automatically based on its weight
         self.tree_preview = ttk.Treeview(preview, columns=("count",), show="tree headings")
         # Set initial headings; they will be updated when the language changes
         self.tree_preview.heading("#0", text=self._t_msg("preview_tree"))
         self.tree_preview.heading("count", text=self._t_msg("file_count"))
-        self.tree_preview.column("#0", width=520)
-        self.tree_preview.column("count", width=120, anchor="center")
-        self.tree_preview.grid(row=1, column=0, sticky="nsew", padx=12, pady=6)
+        self.tree_preview.column("#0", width=COL_DEFAULTS["preview_#0"])
+        self.tree_preview.column("count", width=COL_DEFAULTS["preview_count"], anchor="center")
+        self.tree_preview.grid(row=0, column=0, sticky="nsew", padx=12, pady=(12, 6))
         # Distribution section
         dist = ctk.CTkFrame(right, corner_radius=12, fg_color=pal["elev"])
-        dist.grid(row=2, column=0, sticky="nsew", padx=16, pady=(0, 12))
+        dist.grid(row=3, column=0, sticky="nsew", padx=16, pady=(0, 12))
         dist.grid_columnconfigure((0, 1), weight=1)
         dist.grid_rowconfigure(1, weight=1)
+        dist.grid_propagate(False)
         self._themed_frames.append(dist)
         self.lbl_dist_title = ctk.CTkLabel(dist, text=self._t_msg("dist_summary"), font=font_stack(13, "bold"))
         self.lbl_dist_title.grid(row=0, column=0, sticky="w", padx=12, pady=(12, 0))
@@ -1060,20 +1849,21 @@ class PhotoSorterApp(ctk.CTk):
         self.tree_cam = ttk.Treeview(dist, columns=("cnt",), show="tree headings")
         self.tree_cam.heading("#0", text=self._t_msg("camera"))
         self.tree_cam.heading("cnt", text=self._t_msg("count"))
-        self.tree_cam.column("#0", width=300)
-        self.tree_cam.column("cnt", width=60, anchor="center")
+        self.tree_cam.column("#0", width=COL_DEFAULTS["cam_#0"])
+        self.tree_cam.column("cnt", width=COL_DEFAULTS["cam_cnt"], anchor="center")
         self.tree_cam.grid(row=1, column=0, sticky="nsew", padx=(12, 6), pady=(6, 12))
         self.tree_len = ttk.Treeview(dist, columns=("cnt",), show="tree headings")
         self.tree_len.heading("#0", text=self._t_msg("lens"))
         self.tree_len.heading("cnt", text=self._t_msg("count"))
-        self.tree_len.column("#0", width=300)
-        self.tree_len.column("cnt", width=60, anchor="center")
+        self.tree_len.column("#0", width=COL_DEFAULTS["len_#0"])
+        self.tree_len.column("cnt", width=COL_DEFAULTS["len_cnt"], anchor="center")
         self.tree_len.grid(row=1, column=1, sticky="nsew", padx=(6, 12), pady=(6, 12))
         # Duplicates section
         conflicts = ctk.CTkFrame(right, corner_radius=12, fg_color=pal["elev"])
-        conflicts.grid(row=3, column=0, sticky="nsew", padx=16, pady=(0, 16))
+        conflicts.grid(row=4, column=0, sticky="nsew", padx=16, pady=(0, 16))
         conflicts.grid_columnconfigure(0, weight=1)
         conflicts.grid_rowconfigure(1, weight=1)
+        conflicts.grid_propagate(False)
         self._themed_frames.append(conflicts)
         self.lbl_conflict_title = ctk.CTkLabel(conflicts, text=self._t_msg("conflict_list"), font=font_stack(13, "bold"))
         self.lbl_conflict_title.grid(row=0, column=0, sticky="w", padx=12, pady=(12, 0))
@@ -1081,24 +1871,21 @@ class PhotoSorterApp(ctk.CTk):
         self.tree_conf = ttk.Treeview(conflicts, columns=("dst",), show="headings")
         self.tree_conf.heading("dst", text=self._t_msg("existing_path"))
         # Set a generous column width to ensure long paths are not truncated
-        self.tree_conf.column("dst", anchor="w", width=1000)
+        self.tree_conf.column("dst", anchor="w", width=COL_DEFAULTS["conf_dst"])
         self.tree_conf.grid(row=1, column=0, sticky="nsew", padx=12, pady=(6, 12))
-        # Progress bar and information
-        footer = ctk.CTkFrame(self, corner_radius=0, fg_color=pal["elev"])
-        footer.grid(row=2, column=0, sticky="ew")
-        footer.grid_columnconfigure(0, weight=1)
-        self._footer = footer
-        self.progress = ctk.CTkProgressBar(footer, height=16)
-        self.progress.set(0)
-        self.progress.grid(row=0, column=0, sticky="ew", padx=20, pady=(10, 4))
-        self.progress_info = ctk.CTkLabel(footer, text=self._t_msg("idle"), font=font_stack(12))
-        self._register_lang(self.progress_info, "idle")
-        self.progress_info.grid(row=1, column=0, sticky="w", padx=20, pady=(0, 12))
+        # Restore propagation in one deferred pass — a single geometry solve
+        # instead of one per inserted child
+        self.after_idle(lambda: [f.grid_propagate(True) for f in (preview, dist, conflicts)])
+        self._preview_built = True
+        # The trees were created after the initial styling pass, so assign
+        # the (already configured) style to them now
+        self._style_treeviews_static()
+        self._last_adjust_width = -1
+        self._adjust_columns()
 
     # Helper to create a metric card widget
     def _metric_card(self, parent, title: str, value: str) -> ctk.CTkFrame:
-        mode = ctk.get_appearance_mode().lower()  # type: ignore
-        pal = PALETTE.get(mode, PALETTE["light"])
+        pal = self._pal
         f = ctk.CTkFrame(parent, corner_radius=12, fg_color=pal["elev"], border_width=1, border_color=pal["subtle"])
         ctk.CTkLabel(f, text=title, font=font_stack(12)).pack(anchor="w", padx=12, pady=(10, 0))
         lbl = ctk.CTkLabel(f, text=value, font=font_stack(22, "bold"))
@@ -1109,13 +1896,37 @@ class PhotoSorterApp(ctk.CTk):
     def _set_card(self, card: ctk.CTkFrame, val: str | int) -> None:
         card.value_label.configure(text=str(val))  # type: ignore
 
+    # ----- State persistence -----
+    def _mark_state_dirty(self) -> None:
+        """Schedule a state save instead of writing inside the event callback.
+
+        write_state serializes and hits the disk; doing that synchronously on
+        every theme/language/destination click stalls the UI thread, so dirty
+        changes are batched and flushed shortly after (or on window destroy).
+        """
+        self._state_dirty = True
+        if self._state_flush_id is None:
+            self._state_flush_id = self.after(500, self._flush_state)
+
+    def _flush_state(self) -> None:
+        self._state_flush_id = None
+        if self._state_dirty:
+            self._state_dirty = False
+            write_state(self.state_data)
+
+    def _on_destroy(self, event=None) -> None:
+        # <Destroy> fires once per child widget; only flush for the toplevel
+        if event is not None and event.widget is not self:
+            return
+        self._flush_state()
+
     # ----- UI 액션 -----
     def _toggle_appearance(self, mode: str) -> None:
         ctk.set_appearance_mode(mode)  # type: ignore
         self.state_data["appearance"] = mode
-        write_state(self.state_data)
+        self._mark_state_dirty()
         self._apply_palette()
-        self._style_treeviews()
+        self._style_treeviews_palette()
 
     def _change_dest(self) -> None:
         d = filedialog.askdirectory(title="복사/이동 대상 폴더 선택", initialdir=str(self.dest_root), parent=self)
@@ -1124,16 +1935,51 @@ class PhotoSorterApp(ctk.CTk):
         self.dest_root = Path(d)
         self.lbl_dest.configure(text=str(self.dest_root))
         self.state_data["dest_root"] = str(self.dest_root)
-        write_state(self.state_data)
+        self._mark_state_dirty()
         # Log destination change with language-neutral text
         self._append_log(f"{self._t_msg('dest_folder')} changed: {self.dest_root}")
 
     def _open_settings(self) -> None:
+        # Reuse the dialog once built: re-showing a withdrawn toplevel is
+        # near-instant, while rebuilding it means dozens of widgets plus two
+        # geometry passes on every click
+        if self._settings_dlg is not None and self._settings_dlg.winfo_exists():
+            if self._settings_dlg_lang != self.language:
+                # The cached labels were rendered with _t_msg at build time
+                # and aren't registered for language updates; rebuild when the
+                # language changed while the dialog was hidden
+                self._settings_dlg.destroy()
+                self._settings_dlg = None
+                # Drop language registrations of the destroyed widgets
+                try:
+                    self._lang_widgets = [(w, k) for w, k in self._lang_widgets if w.winfo_exists()]
+                except Exception:
+                    pass
+            else:
+                dlg = self._settings_dlg
+                # Refresh the bits that can change while the dialog is hidden
+                self._settings_dest_label.configure(text=str(self.dest_root))
+                dlg.title(self._t_msg("settings_title"))
+                dlg.deiconify()
+                dlg.lift()
+                dlg.grab_set()
+                return
         # Settings dialog
         dlg = ctk.CTkToplevel(self)
+        self._settings_dlg = dlg
+        self._settings_dlg_lang = self.language
         dlg.title(self._t_msg("settings_title"))
         dlg.geometry("600x500")
         dlg.grab_set()
+
+        def _hide() -> None:
+            try:
+                dlg.grab_release()
+            except Exception:
+                pass
+            dlg.withdraw()
+        # Hide instead of destroy so the dialog can be shown again cheaply
+        dlg.protocol("WM_DELETE_WINDOW", _hide)
         # Use a scrollable frame so all options are visible even on smaller screens
         scroll = ctk.CTkScrollableFrame(dlg, fg_color="transparent")
         scroll.pack(fill="both", expand=True)
@@ -1143,11 +1989,12 @@ class PhotoSorterApp(ctk.CTk):
         dest_row.pack(fill="x", padx=18)
         dest_label = ctk.CTkLabel(dest_row, text=str(self.dest_root), wraplength=420, justify="left")
         dest_label.pack(side="left", padx=(6, 6), pady=6)
+        self._settings_dest_label = dest_label
         ctk.CTkButton(dest_row, text=self._t_msg("change"), width=84, command=lambda: self._settings_change_dest(dest_label)).pack(side="right", padx=6)
         # Default duplicate handling policy
         ctk.CTkLabel(scroll, text=self._t_msg("dup_default_policy"), font=font_stack(14, "bold")).pack(anchor="w", padx=18, pady=(16, 6))
-        pol = ctk.CTkSegmentedButton(scroll, values=["rename", "skip", "ask"])
-        pol.set(self.policy_var.get())
+        # Bound to the shared vars directly; no manual get/set syncing needed
+        pol = ctk.CTkSegmentedButton(scroll, values=["rename", "skip", "ask"], variable=self.policy_var)
         pol.pack(fill="x", padx=18)
         # Language selection (English/Korean)
         ctk.CTkLabel(scroll, text=self._t_msg("select_language"), font=font_stack(14, "bold")).pack(anchor="w", padx=18, pady=(16, 6))
@@ -1157,8 +2004,8 @@ class PhotoSorterApp(ctk.CTk):
             new_lang = lang_seg.get()
             self.language = new_lang
             self.state_data["language"] = new_lang
-            write_state(self.state_data)
-        # Refresh the UI
+            self._mark_state_dirty()
+            # Refresh the UI
             self._update_ui_language()
         lang_seg.configure(command=_on_lang_change)
         lang_seg.pack(fill="x", padx=18)
@@ -1176,17 +2023,27 @@ class PhotoSorterApp(ctk.CTk):
         # Slider can adjust between 0.8 and 1.5
         scale = ctk.CTkSlider(scale_row, from_=0.8, to=1.5, number_of_steps=14)
         scale.set(self.state_data.get("scale", 1.0))
-        # Update preview and UI immediately when scale changes
+        # Update preview and UI when scale changes (debounced)
+        def _apply_scale(v: float) -> None:
+            self._scale_after_id = None
+            # Change widget scaling — a global retheme, so only run it once
+            # the slider has settled
+            ctk.set_widget_scaling(v)  # type: ignore
+            self._adjust_layout(force=True)
+
         def _on_scale_change(val: float) -> None:
             v = round(float(val), 2)
-            # Update the displayed scale value
+            # Update the displayed scale value immediately (cheap)
             scale_val_label.configure(text=f"{v:.2f}")
-            # Change widget scaling in real-time
-            ctk.set_widget_scaling(v)  # type: ignore
-            # Adjust layout before saving as well
             self.state_data["scale"] = v
-            # Immediately adjust the layout on the next event loop
-            self.after(10, lambda: self._adjust_layout(force=True))
+            # The slider fires many times per drag; coalesce so only the
+            # final value pays for the full rescale + relayout
+            if self._scale_after_id is not None:
+                try:
+                    self.after_cancel(self._scale_after_id)
+                except Exception:
+                    pass
+            self._scale_after_id = self.after(80, lambda: _apply_scale(v))
         scale.configure(command=_on_scale_change)
         scale.pack(side="left", expand=True, fill="x")
         scale_val_label.pack(side="right")
@@ -1194,14 +2051,11 @@ class PhotoSorterApp(ctk.CTk):
         ctk.CTkLabel(scroll, text=self._t_msg("group_hier_options"), font=font_stack(14, "bold")).pack(anchor="w", padx=18, pady=(16, 6))
         row1 = ctk.CTkFrame(scroll)
         row1.pack(fill="x", padx=18)
-        gb = ctk.CTkSegmentedButton(row1, values=["camera", "lens"])
-        gb.set(self.group_by_var.get())
+        gb = ctk.CTkSegmentedButton(row1, values=["camera", "lens"], variable=self.group_by_var)
         gb.pack(side="left", expand=True, fill="x", padx=(0, 6))
-        hb = ctk.CTkSegmentedButton(row1, values=["device-first", "date-first"])
-        hb.set(self.hier_var.get())
+        hb = ctk.CTkSegmentedButton(row1, values=["device-first", "date-first"], variable=self.hier_var)
         hb.pack(side="left", expand=True, fill="x", padx=(6, 6))
-        act = ctk.CTkSegmentedButton(row1, values=["copy", "move"])
-        act.set(self.action_var.get())
+        act = ctk.CTkSegmentedButton(row1, values=["copy", "move"], variable=self.action_var)
         act.pack(side="left", expand=True, fill="x", padx=(6, 0))
         sw_split = ctk.CTkSwitch(scroll, text=self._t_msg("raw_split"), variable=self.split_var, onvalue=True, offvalue=False)
         sw_split.pack(anchor="w", padx=18, pady=(6, 2))
@@ -1241,31 +2095,28 @@ class PhotoSorterApp(ctk.CTk):
         row_btn = ctk.CTkFrame(scroll)
         row_btn.pack(fill="x", padx=18, pady=16)
         def _save() -> None:
-            self.policy_var.set(pol.get())
-            self.state_data["policy"] = pol.get()
+            # The segmented buttons write straight into the shared vars, so
+            # saving is just snapshotting the vars into state_data
+            self.state_data["policy"] = self.policy_var.get()
             self.state_data["scale"] = round(scale.get(), 2)
             ctk.set_widget_scaling(self.state_data["scale"])  # type: ignore
-            self.state_data["group_by"] = gb.get()
-            self.group_by_var.set(gb.get())
-            self.state_data["hierarchy"] = hb.get()
-            self.hier_var.set(hb.get())
-            self.state_data["action"] = act.get()
-            self.action_var.set(act.get())
+            self.state_data["group_by"] = self.group_by_var.get()
+            self.state_data["hierarchy"] = self.hier_var.get()
+            self.state_data["action"] = self.action_var.get()
             self.state_data["split_raw_jpg"] = bool(self.split_var.get())
             self.state_data["skip_hash_dup"] = bool(self.skip_hash_var.get())
             self.state_data["max_workers"] = max(1, int(self.workers_var.get()))
-            write_state(self.state_data)
-            dlg.destroy()
-            # 저장 후 레이아웃과 언어 갱신
+            self._mark_state_dirty()
+            _hide()
+            # 저장 후 레이아웃 갱신 (언어는 _on_lang_change가 즉시 반영)
             self.after(50, lambda: self._adjust_layout(force=True))
-            self.after(60, self._update_ui_language)
             self._append_log(
                 f"[설정] 정책:{self.state_data['policy']} / 테마:{self.state_data['appearance']} / 스케일:{self.state_data['scale']} / "
                 f"그룹:{self.state_data['group_by']} / 계층:{self.state_data['hierarchy']} / 동작:{self.state_data['action']} / "
                 f"분리:{self.state_data['split_raw_jpg']} / 해시:{self.state_data['skip_hash_dup']}"
             )
         ctk.CTkButton(row_btn, text=self._t_msg("save"), width=84, command=_save).pack(side="right", padx=(8, 0))
-        ctk.CTkButton(row_btn, text=self._t_msg("close"), width=84, command=dlg.destroy).pack(side="right", padx=(0, 8))
+        ctk.CTkButton(row_btn, text=self._t_msg("close"), width=84, command=_hide).pack(side="right", padx=(0, 8))
         # Folder tree example
         ctk.CTkLabel(scroll, text=self._t_msg("folder_tree_example"), font=font_stack(14, "bold")).pack(anchor="w", padx=18, pady=(8, 4))
         example_frame = ctk.CTkFrame(scroll, fg_color="transparent")
@@ -1279,8 +2130,8 @@ class PhotoSorterApp(ctk.CTk):
         example_label.pack(anchor="w")
         def _update_example(*args):
             # Generate a folder tree example using sample values
-            group_val = gb.get()
-            hier_val = hb.get()
+            group_val = self.group_by_var.get()
+            hier_val = self.hier_var.get()
             split_raw = bool(self.split_var.get())
             dummy_group = "Camera" if group_val == "camera" else "Lens"
             year = datetime.now().strftime("%Y")
@@ -1295,13 +2146,11 @@ class PhotoSorterApp(ctk.CTk):
             example_path = os.path.join(*path_parts)
             example_label.configure(text=example_path)
         _update_example()
-        # Update the example when options change via event bindings
-        gb.configure(command=lambda *_: (_sync_gb(), _update_example()))  # type: ignore
-        hb.configure(command=lambda *_: (_sync_hb(), _update_example()))  # type: ignore
-        act.configure(command=lambda *_: (_sync_act()))  # 유지
-        def _on_split_change():
-            _update_example()
-        sw_split.configure(command=lambda *_: (_on_split_change()))
+        # Update the example when options change (the vars themselves are
+        # already kept in sync by the variable= bindings)
+        gb.configure(command=lambda *_: _update_example())
+        hb.configure(command=lambda *_: _update_example())
+        sw_split.configure(command=lambda *_: _update_example())
 
     def _settings_change_dest(self, label_widget) -> None:
         d = filedialog.askdirectory(title="Select destination folder for copy/move", initialdir=str(self.dest_root), parent=self)
@@ -1311,7 +2160,7 @@ class PhotoSorterApp(ctk.CTk):
         label_widget.configure(text=str(self.dest_root))
         self.lbl_dest.configure(text=str(self.dest_root))
         self.state_data["dest_root"] = str(self.dest_root)
-        write_state(self.state_data)
+        self._mark_state_dirty()
         # Log destination change with language-neutral text
         self._append_log(f"[Settings] {self._t_msg('dest_folder')} changed: {self.dest_root}")
 
@@ -1326,24 +2175,34 @@ class PhotoSorterApp(ctk.CTk):
         self.btn_start.configure(state="disabled")
         self.progress.set(0)
         self.progress_info.configure(text=self._t_msg('idle'))
-        for t in (self.tree_preview, self.tree_conf, self.tree_cam, self.tree_len):
-            for i in t.get_children():
-                t.delete(i)
-        for card in (self.card_total, self.card_dates, self.card_conf, self.card_cam, self.card_len):
-            self._set_card(card, 0)
+        if self._preview_built:
+            for t in (self.tree_preview, self.tree_conf, self.tree_cam, self.tree_len):
+                for i in t.get_children():
+                    t.delete(i)
+            for card in (self.card_total, self.card_dates, self.card_conf, self.card_cam, self.card_len):
+                self._set_card(card, 0)
+
+    def _existing_names(self, dest_dir: Path) -> set[str]:
+        """Return (and cache) the set of file names present in dest_dir."""
+        names = self._existing.get(dest_dir)
+        if names is None:
+            try:
+                names = set(os.listdir(dest_dir))
+            except OSError:
+                # Directory doesn't exist yet (created lazily during sort)
+                names = set()
+            self._existing[dest_dir] = names
+        return names
 
     # 계획
     def _target_dir_for(self, meta: dict) -> Path:
-        group = meta["camera"] if self.group_by_var.get() == "camera" else meta["lens"]
-        group = sanitize(group)
-        # Build a three-level folder structure: year/month/date
-        if self.hier_var.get() == "device-first":
-            base = self.dest_root / group / meta["year"] / meta["month"] / meta["date"]
-        else:
-            base = self.dest_root / meta["year"] / meta["month"] / meta["date"] / group
-        if self.split_var.get():
-            base = base / meta["kind"]
-        return base
+        return plan_dir(
+            meta,
+            self.group_by_var.get(),
+            self.hier_var.get(),
+            bool(self.split_var.get()),
+            self.dest_root,
+        )
 
     def scan_preview(self) -> None:
         if not self.src_dir or not self.src_dir.exists():
@@ -1360,73 +2219,138 @@ class PhotoSorterApp(ctk.CTk):
                 msg = f"Failed to create destination folder:\n{self.dest_root}\n{e}"
             messagebox.showerror(APP_NAME, msg, parent=self)
             return
-        self.files = list(walk_images(self.src_dir))
-        if not self.files:
+        # Stream the scandir walk straight into the extractor instead of
+        # materializing the whole file list first: EXIF parsing starts while
+        # the walk is still running. The first 256 entries double as the
+        # big-job probe for the pool choice below.
+        walk_iter = iter(walk_images(self.src_dir))
+        head = [Path(p) for p in itertools.islice(walk_iter, 256)]
+        if not head:
             # Inform the user if no image files were found
             messagebox.showinfo(APP_NAME, self._t_msg("error_no_images"), parent=self)
             return
+        if not self._preview_built:
+            self._build_preview_panes()
         # Collect metadata
         # Use the specified number of worker threads to extract metadata in parallel
+        self.files = []
         self.metas = []
-        cam_counts: dict[str, int] = {}
-        len_counts: dict[str, int] = {}
+        self.plan.clear()
+        self.conflicts.clear()
+        self._existing.clear()
+        cam_counts: collections.Counter = collections.Counter()
+        len_counts: collections.Counter = collections.Counter()
         dateset: set[str] = set()
+        # Snapshot the planning options once (not per file) and fold plan
+        # building plus the duplicate check into the extraction loop, so the
+        # scan makes a single pass over the metas instead of three
+        group_by = self.group_by_var.get()
+        hier = self.hier_var.get()
+        split = bool(self.split_var.get())
+        dest_root = self.dest_root
+
+        def _absorb(m: dict) -> None:
+            # Remember the planned dir on the meta so the sort phase doesn't
+            # redo the sanitize + path joins (metas are per-run copies, so
+            # this never leaks into the extract_meta cache)
+            out_dir = plan_dir(m, group_by, hier, split, dest_root)
+            m["out_dir"] = out_dir
+            src = m["path"]
+            self.plan.setdefault(out_dir, []).append(src)
+            # Pre-existing duplicates: each target dir is listed once and
+            # cached, so this is a set lookup rather than a stat per file
+            if src.name in self._existing_names(out_dir):
+                self.conflicts.append((src, out_dir / src.name))
+
         workers = max(1, int(self.workers_var.get()))
+        paths_iter = itertools.chain(head, (Path(p) for p in walk_iter))
         # Perform extract_meta in parallel; use sequential processing if there are few files or only one worker
-        if workers > 1 and len(self.files) > 1:
+        if workers > 1 and len(head) > 1:
             import concurrent.futures
                 # Limit the maximum number of workers to avoid oversubscription
             max_workers = min(workers, os.cpu_count() or 1)
             try:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    # Use enumerate to periodically update progress in the event loop
-                    for idx, m in enumerate(executor.map(extract_meta, self.files)):
-                        self.metas.append(m)
-                        cam_counts[m["camera"]] = cam_counts.get(m["camera"], 0) + 1
-                        len_counts[m["lens"]] = len_counts.get(m["lens"], 0) + 1
-                        dateset.add(m["date"])
-                        # Periodically update the UI
-                        if idx % 50 == 0:
+                # EXIF parsing is mostly CPU-bound Python, so big jobs escape
+                # the GIL with a process pool; below the threshold the fork +
+                # pickle overhead outweighs the win and threads stay faster
+                if len(head) >= 256:
+                    pool_cls = concurrent.futures.ProcessPoolExecutor
+                else:
+                    pool_cls = concurrent.futures.ThreadPoolExecutor
+                with pool_cls(max_workers=max_workers) as executor:
+                    # Submit ~64-file batches as the walk produces them:
+                    # extract_meta_batch pre-aggregates per batch, so each
+                    # completion merges a Counter instead of the main thread
+                    # touching dicts once per file.
+                    futs = []
+                    batch: list[Path] = []
+                    for pp in paths_iter:
+                        self.files.append(pp)
+                        batch.append(pp)
+                        if len(batch) >= 64:
+                            futs.append(executor.submit(extract_meta_batch, batch))
+                            batch = []
+                    if batch:
+                        futs.append(executor.submit(extract_meta_batch, batch))
+                    for idx, fut in enumerate(concurrent.futures.as_completed(futs)):
+                        metas, cams, lens_, dates = fut.result()
+                        self.metas.extend(metas)
+                        for m in metas:
+                            _absorb(m)
+                        cam_counts.update(cams)
+                        len_counts.update(lens_)
+                        dateset |= dates
+                        # Progress goes through the ui_queue like the sort
+                        # phase; since this loop owns the main thread, run the
+                        # drain directly and let idletasks paint it — a full
+                        # update() would also dispatch button clicks and allow
+                        # re-entering scan_preview mid-walk
+                        self._ui_post(("scan_progress", len(self.metas)))
+                        if idx % 16 == 0:
+                            self._drain_ui_once()
                             self.update_idletasks()
             except Exception:
-                # Fall back to sequential processing if errors occur during parallel extraction
+                # Fall back to sequential processing if errors occur during
+                # parallel extraction (re-walk: the stream may be half-drained)
+                self.files = [Path(p) for p in walk_images(self.src_dir)]
                 self.metas.clear()
+                self.plan.clear(); self.conflicts.clear(); self._existing.clear()
                 cam_counts.clear(); len_counts.clear(); dateset.clear()
                 for idx, p in enumerate(self.files):
                     m = extract_meta(p)
                     self.metas.append(m)
-                    cam_counts[m["camera"]] = cam_counts.get(m["camera"], 0) + 1
-                    len_counts[m["lens"]] = len_counts.get(m["lens"], 0) + 1
+                    _absorb(m)
+                    cam_counts[m["camera"]] += 1
+                    len_counts[m["lens"]] += 1
                     dateset.add(m["date"])
                     if idx % 50 == 0:
+                        self._ui_post(("scan_progress", idx))
+                    if idx % 800 == 0:
+                        self._drain_ui_once()
                         self.update_idletasks()
         else:
             # Sequential processing
-            for idx, p in enumerate(self.files):
+            for idx, p in enumerate(paths_iter):
+                self.files.append(p)
                 m = extract_meta(p)
                 self.metas.append(m)
-                cam_counts[m["camera"]] = cam_counts.get(m["camera"], 0) + 1
-                len_counts[m["lens"]] = len_counts.get(m["lens"], 0) + 1
+                _absorb(m)
+                cam_counts[m["camera"]] += 1
+                len_counts[m["lens"]] += 1
                 dateset.add(m["date"])
                 if idx % 50 == 0:
+                    self._ui_post(("scan_progress", idx))
+                if idx % 800 == 0:
+                    self._drain_ui_once()
                     self.update_idletasks()
-        # Build the plan
-        self.plan.clear()
-        self.conflicts.clear()
-        for m in self.metas:
-            out_dir = self._target_dir_for(m)
-            self.plan.setdefault(out_dir, []).append(m["path"])
-        # Scan for pre-existing duplicates
-        for out_dir, flist in self.plan.items():
-            for src in flist:
-                dst = out_dir / src.name
-                if dst.exists():
-                    self.conflicts.append((src, dst))
-        # Fill the preview tree
-        for i in self.tree_preview.get_children():
-            self.tree_preview.delete(i)
+        # Fill the preview tree (one delete call, low-level inserts: each
+        # .insert() is a full ttk wrapper + Tcl round-trip per row, which
+        # stalls for seconds at thousands of conflict rows)
+        kids = self.tree_preview.get_children()
+        if kids:
+            self.tree_preview.delete(*kids)
         # For tree_preview, show only top-level group, using dest_root-relative paths instead of full paths
-        by_top: dict[str, int] = {}
+        by_top: collections.Counter = collections.Counter()
         for tdir, srcs in self.plan.items():
             try:
                 # Group by the first path element under dest_root
@@ -1434,27 +2358,37 @@ class PhotoSorterApp(ctk.CTk):
                 top = rel.parts[0] if rel.parts else str(tdir)
             except Exception:
                 top = str(tdir)
-            by_top[top] = by_top.get(top, 0) + len(srcs)
+            by_top[top] += len(srcs)
+        ins = self.tree_preview.tk.call
+        w = str(self.tree_preview)
         for top, cnt in sorted(by_top.items()):
-            self.tree_preview.insert("", "end", text=top, values=(cnt,))
+            ins(w, "insert", "", "end", "-text", top, "-values", (cnt,))
         # Fill distribution summary
         for tv in (self.tree_cam, self.tree_len):
-            for i in tv.get_children():
-                tv.delete(i)
+            kids = tv.get_children()
+            if kids:
+                tv.delete(*kids)
+        ins = self.tree_cam.tk.call
+        w = str(self.tree_cam)
         for k, v in sorted(cam_counts.items(), key=lambda kv: (-kv[1], kv[0])):
-            self.tree_cam.insert("", "end", text=k, values=(v,))
+            ins(w, "insert", "", "end", "-text", k, "-values", (v,))
+        ins = self.tree_len.tk.call
+        w = str(self.tree_len)
         for k, v in sorted(len_counts.items(), key=lambda kv: (-kv[1], kv[0])):
-            self.tree_len.insert("", "end", text=k, values=(v,))
+            ins(w, "insert", "", "end", "-text", k, "-values", (v,))
         # Populate duplicate list
-        for i in self.tree_conf.get_children():
-            self.tree_conf.delete(i)
+        kids = self.tree_conf.get_children()
+        if kids:
+            self.tree_conf.delete(*kids)
+        ins = self.tree_conf.tk.call
+        w = str(self.tree_conf)
         for _, dst in self.conflicts:
             # Display duplicate paths relative to dest_root
             try:
                 rel_dst = dst.relative_to(self.dest_root)
-                self.tree_conf.insert("", "end", values=(str(rel_dst),))
+                ins(w, "insert", "", "end", "-values", (str(rel_dst),))
             except Exception:
-                self.tree_conf.insert("", "end", values=(str(dst),))
+                ins(w, "insert", "", "end", "-values", (str(dst),))
         # Update summary cards
         self._set_card(self.card_total, human(len(self.files)))
         self._set_card(self.card_dates, human(len(dateset)))
@@ -1468,7 +2402,9 @@ class PhotoSorterApp(ctk.CTk):
             eff_workers = 1
         # Show up to 20 sample folder paths relative to dest_root
         sample_lines: list[str] = []
-        preview_targets = sorted(list(self.plan.keys()))[:20]
+        # nsmallest is O(n log 20) — no need to sort thousands of folder
+        # paths just to show the first twenty
+        preview_targets = heapq.nsmallest(20, self.plan.keys())
         for p in preview_targets:
             try:
                 rel = p.relative_to(self.dest_root)
@@ -1553,11 +2489,9 @@ class PhotoSorterApp(ctk.CTk):
     def _worker_sort(self) -> None:
         total = len(self.metas)
         start_ts = time.time()
-        # Shared counters
-        done = 0
-        success = 0
-        skipped = 0
-        failed = 0
+        # Aggregate tallies; each worker thread counts locally and folds its
+        # numbers in here (see _flush_counts below)
+        totals: collections.Counter = collections.Counter()
         # Store messages when errors occur
         errors: list[str] = []
         # Store a list of skipped files
@@ -1565,45 +2499,114 @@ class PhotoSorterApp(ctk.CTk):
         policy = self.policy_var.get()
         action = self.action_var.get()
         skip_hash = bool(self.skip_hash_var.get())
+        cas_mode = bool(self.state_data.get("cas_mode", False))
+        cas_root = self.dest_root / ".cas"
+        # Snapshot the planning options once; process() runs per file and a
+        # Tk .get() per call would mean thousands of Tcl round-trips
+        group_by = self.group_by_var.get()
+        hier = self.hier_var.get()
+        split = bool(self.split_var.get())
+        dest_root = self.dest_root
+        # Every source lives under src_dir and every target under dest_root,
+        # so one stat pair decides the move strategy for the whole run instead
+        # of two stats per file inside the transfer loop
+        same_dev = action == "move" and same_device(self.src_dir, dest_root)
+        # Status strings never change mid-run; resolve them once instead of
+        # doing a translation lookup per processed file
+        msg_skip_same = self._t_msg("skip_same_content")
+        msg_skip_dup = self._t_msg("skip_duplicate_name")
+        msg_skip_user = self._t_msg("skip_user")
+        msg_processed = self._t_msg("processed_file")
+        msg_fail = self._t_msg("failure_prefix")
         # Determine worker thread count (force 1 for 'ask' policy)
         workers = max(1, int(self.workers_var.get()))
         if policy == "ask" and workers > 1:
             workers = 1  # disable parallelism for interactive duplicate handling
         lock = threading.Lock()
+        # Per-thread counters: bumping two shared integers under the lock for
+        # every file serializes the workers on the hot path, so each thread
+        # tallies locally and folds into the shared totals every 64 files and
+        # once more when it exits. The 'done' figure fed to the status line is
+        # therefore slightly approximate mid-run, which the progress display
+        # tolerates (it is throttled anyway).
+        tls = threading.local()
+
+        def _local_counts() -> collections.Counter:
+            c = getattr(tls, "counts", None)
+            if c is None:
+                c = tls.counts = collections.Counter()
+            return c
+
+        def _flush_counts() -> None:
+            c = getattr(tls, "counts", None)
+            if c:
+                with lock:
+                    totals.update(c)
+                c.clear()
+
+        def _tally(key: str) -> int:
+            """Count one file for this thread; return the approximate done total."""
+            c = _local_counts()
+            c[key] += 1
+            c["done"] += 1
+            if c["done"] >= 64:
+                _flush_counts()
+            return totals["done"] + c["done"]
+
+        # Warm the hash caches for known name collisions with overlapping
+        # reads before the copy loop starts consuming I/O bandwidth
+        if skip_hash and self.conflicts:
+            batch_warm_hashes(self.conflicts)
+        # Create every planned directory once up front: one mkdir per folder
+        # rather than one syscall per file inside the hot loop
+        for out_dir in self.plan:
+            try:
+                out_dir.mkdir(parents=True, exist_ok=True)
+            except Exception:
+                pass
 
         def process(m):
-            nonlocal done, success, skipped, failed
             if self.stop_flag.is_set():
                 return
             src = m["path"]
             try:
-                out_dir = self._target_dir_for(m)
-                out_dir.mkdir(parents=True, exist_ok=True)
+                # Planned during scan_preview; fall back to recomputing if a
+                # meta somehow arrives unplanned
+                out_dir = m.get("out_dir") or plan_dir(m, group_by, hier, split, dest_root)
                 dst = out_dir / src.name
-                # Duplicate handling
-                if dst.exists():
-                    # Compare content hashes; skip if file contents are identical
-                    if skip_hash and file_hash(src) == file_hash(dst):
+                # Test and reserve the destination name in one critical
+                # section: two sources sharing a basename (DCIM counter
+                # rollover puts IMG_0001.JPG in both 100CANON and 101CANON)
+                # must never both pass the membership test, or the second
+                # transfer would overwrite the first
+                with lock:
+                    names = self._existing_names(out_dir)
+                    dup = src.name in names
+                    if not dup:
+                        names.add(src.name)
+                # Duplicate handling (in-memory name lookup, no stat per file)
+                if dup:
+                    # Compare sizes then content hashes; skip if identical
+                    if skip_hash and same_content(src, dst):
                         with lock:
-                            skipped += 1
-                            done += 1
                             skipped_list.append(str(src))
+                        done = _tally("skipped")
                         # Perform status updates at regular intervals only
                         if done <= 10 or done % max(1, total // 100) == 0 or done == total:
-                            self._enqueue_status(done, total, start_ts, f"{self._t_msg('skip_same_content')}: {src.name}")
+                            self._enqueue_status(done, total, start_ts, f"{msg_skip_same}: {src.name}")
                         return
                     # Branch according to duplicate filename handling policy
                     if policy == "rename":
                         # Save using a new name
-                        dst = unique_dest(out_dir, src.name)
+                        with lock:
+                            dst = unique_dest(out_dir, src.name, names)
                     elif policy == "skip":
                         # Skip the file and add to the skipped list
                         with lock:
-                            skipped += 1
-                            done += 1
                             skipped_list.append(str(src))
+                        done = _tally("skipped")
                         if done <= 10 or done % max(1, total // 100) == 0 or done == total:
-                            self._enqueue_status(done, total, start_ts, f"{self._t_msg('skip_duplicate_name')}: {src.name}")
+                            self._enqueue_status(done, total, start_ts, f"{msg_skip_dup}: {src.name}")
                         return
                     else:
                         # 'ask' policy: prompt the user (called only in single-threaded mode)
@@ -1614,90 +2617,176 @@ class PhotoSorterApp(ctk.CTk):
                             return
                         elif resp == "skip":
                             with lock:
-                                skipped += 1
-                                done += 1
                                 skipped_list.append(str(src))
+                            done = _tally("skipped")
                             if done <= 10 or done % max(1, total // 100) == 0 or done == total:
-                                self._enqueue_status(done, total, start_ts, f"{self._t_msg('skip_user')}: {src.name}")
+                                self._enqueue_status(done, total, start_ts, f"{msg_skip_user}: {src.name}")
                             return
                         else:
                             # Save using a new name based on user selection
-                            dst = unique_dest(out_dir, src.name)
+                            with lock:
+                                dst = unique_dest(out_dir, src.name, names)
                 # Copy or move the file
-                if action == "move":
-                    shutil.move(str(src), str(dst))  # type: ignore
-                else:
-                    shutil.copy2(str(src), str(dst))  # type: ignore
-                with lock:
-                    success += 1
-                    done += 1
-                self._enqueue_status(done, total, start_ts, f"{self._t_msg('processed_file')}: {dst.name}")
+                def _transfer() -> None:
+                    if action == "move":
+                        if same_dev:
+                            # Same filesystem: a rename is a single syscall
+                            os.replace(src, dst)
+                        else:
+                            # Cross-device: copy via the fast path, then drop
+                            # the source (shutil.move would fall back to a
+                            # plain buffered read/write copy here)
+                            fast_copy(src, dst)
+                            os.unlink(src)
+                    elif cas_mode:
+                        try:
+                            cas_store(src, dst, cas_root)
+                        except OSError:
+                            # Cross-device links or FS without hardlink support
+                            fast_copy(src, dst)
+                    else:
+                        fast_copy(src, dst)
+
+                try:
+                    _transfer()
+                except FileNotFoundError:
+                    # The pre-created directory was removed underneath us;
+                    # recreate it lazily and retry once
+                    out_dir.mkdir(parents=True, exist_ok=True)
+                    _transfer()
+                done = _tally("success")
+                self._enqueue_status(done, total, start_ts, f"{msg_processed}: {dst.name}")
             except Exception as e:
-                with lock:
-                    failed += 1
-                    done += 1
+                done = _tally("failed")
                 err_msg = f"{src} : {e}"
-                errors.append(err_msg)
+                with lock:
+                    errors.append(err_msg)
                 # Write failure information to the log using translated prefix
-                log_write(f"{self._t_msg('failure_prefix')}: {src} / {e}\n{traceback.format_exc()}")
+                log_write(f"{msg_fail}: {src} / {e}\n{traceback.format_exc()}")
                 # Progress updates are performed only at intervals (checked in the outer function)
                 if done <= 10 or done % max(1, total // 100) == 0 or done == total:
-                    self._enqueue_status(done, total, start_ts, f"{self._t_msg('failure_prefix')}: {src.name}")
+                    self._enqueue_status(done, total, start_ts, f"{msg_fail}: {src.name}")
 
         # Parallel execution
         if workers > 1:
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = [executor.submit(process, m) for m in self.metas]
-                # wait for completion
-                for f in futures:
-                    # Terminate if stop_flag is set in the main thread
-                    if self.stop_flag.is_set():
+            # Dispatcher/worker pattern: a bounded queue feeds dedicated I/O
+            # threads so copies overlap SD-card reads with destination
+            # writes, instead of submitting one giant up-front batch.
+            io_workers = min(workers, 8, (os.cpu_count() or 1) * 2)
+            # In-flight window scales with the worker count (a few batches of
+            # lookahead each) instead of a fixed 256, so small worker counts
+            # don't queue far more work than they can cancel on stop
+            copy_q: queue.Queue = queue.Queue(maxsize=max(32, io_workers * 4))
+            _sentinel = object()
+
+            def _io_worker() -> None:
+                while True:
+                    m = copy_q.get()
+                    if m is _sentinel:
                         break
                     try:
-                        f.result()
+                        process(m)
                     except Exception:
                         pass
+                # Fold this thread's remaining tallies before it exits
+                _flush_counts()
+
+            threads = [threading.Thread(target=_io_worker, daemon=True) for _ in range(io_workers)]
+            for t in threads:
+                t.start()
+            for m in self.metas:
+                # The bounded put blocks when workers fall behind, keeping
+                # the in-flight window (and memory) small
+                if self.stop_flag.is_set():
+                    break
+                copy_q.put(m)
+            if self.stop_flag.is_set():
+                # Discard whatever is still queued so Stop doesn't wait for
+                # workers to cycle through (and no-op) the backlog
+                try:
+                    while True:
+                        copy_q.get_nowait()
+                except queue.Empty:
+                    pass
+            for _ in threads:
+                copy_q.put(_sentinel)
+            for t in threads:
+                t.join()
         else:
             # Sequential execution
             for m in self.metas:
                 if self.stop_flag.is_set():
                     break
                 process(m)
+            _flush_counts()
         elapsed = time.time() - start_ts
         # Include error and skipped lists in the finish event payload
-        self.ui_queue.put(("finish", {
+        # (workers have joined, so the totals are final here)
+        self._ui_post(("finish", {
             "total": total,
-            "success": success,
-            "skipped": skipped,
-            "failed": failed,
+            "success": totals["success"],
+            "skipped": totals["skipped"],
+            "failed": totals["failed"],
             "elapsed": elapsed,
             "errors": errors,
             "skipped_list": skipped_list,
         }))
 
+    def _ui_post(self, msg: tuple) -> None:
+        """Queue a message for the UI thread (lock-free append + flag)."""
+        self.ui_queue.append(msg)
+        self._ui_dirty.set()
+
     def _enqueue_status(self, done: int, total: int, start_ts: float, line: str) -> None:
         elapsed = time.time() - start_ts
         speed = done / elapsed if elapsed > 0 else 0
         eta = (total - done) / speed if speed > 0 else 0
-        self.ui_queue.put(("status", {"done": done, "total": total, "elapsed": elapsed, "eta": eta, "line": line}))
-
-    def _drain_ui_queue(self) -> None:
-        try:
+        # Only the most recent status matters for the progress bar, so it
+        # lives in a single overwrite slot; log lines accumulate in a bounded
+        # deque and are inserted in one Tk call per drain tick
+        self._latest_status = {"done": done, "total": total, "elapsed": elapsed, "eta": eta, "line": line}
+        self._log_batch.append(line)
+        self._ui_dirty.set()
+
+    def _drain_ui_once(self) -> None:
+        """Process pending UI messages now, without pumping the event loop."""
+        if self._ui_dirty.is_set():
+            # Clear the flag *before* draining: a worker that appends and
+            # sets the flag mid-drain is then picked up on the next tick.
+            # Clearing afterwards could wipe out that set and strand the
+            # message (fatal for "finish", which is the last one ever posted).
+            self._ui_dirty.clear()
+            # Drain with popleft: list()+clear() is two operations, and an
+            # append landing between them would be lost (a dropped "finish"
+            # leaves the UI stuck). popleft is atomic and loses nothing.
+            msgs = []
             while True:
-                kind, payload = self.ui_queue.get_nowait()
-                if kind == "status":
-                    done, total = payload["done"], payload["total"]
-                    frac = done / total if total else 0
-                    self.progress.set(frac)
-                    self.progress_info.configure(
-                        text=(
-                            f"{done}/{total}  ({frac*100:0.1f}%)   "
-                            f"속도: {done / max(payload['elapsed'], 1e-6):0.2f} 파일/초   "
-                            f"ETA: {payload['eta']:0.1f}s   |  {payload['line']}"
-                        )
+                try:
+                    msgs.append(self.ui_queue.popleft())
+                except IndexError:
+                    break
+            # One progress update per tick: only the newest status matters
+            payload, self._latest_status = self._latest_status, None
+            if payload is not None:
+                done, total = payload["done"], payload["total"]
+                frac = done / total if total else 0
+                self.progress.set(frac)
+                self.progress_info.configure(
+                    text=(
+                        f"{done}/{total}  ({frac*100:0.1f}%)   "
+                        f"속도: {done / max(payload['elapsed'], 1e-6):0.2f} 파일/초   "
+                        f"ETA: {payload['eta']:0.1f}s   |  {payload['line']}"
                     )
-                    self._append_log(payload["line"])
+                )
+            # All accumulated log lines land in a single insert
+            if self._log_batch:
+                lines = list(self._log_batch)
+                self._log_batch.clear()
+                self._append_log("\n".join(lines))
+            for kind, payload in msgs:
+                if kind == "scan_progress":
+                    # Lightweight label update only; no forced redraw
+                    self.progress_info.configure(text=self._t_msg("scan_progress").format(n=payload))
                 elif kind == "finish":
                     # Handle completion of sorting task
                     total = payload.get("total", 0)
@@ -1756,8 +2845,9 @@ class PhotoSorterApp(ctk.CTk):
                         messagebox.showinfo(APP_NAME, "\n".join(lines), parent=self)
                     except Exception:
                         pass
-        except queue.Empty:
-            pass
+
+    def _drain_ui_queue(self) -> None:
+        self._drain_ui_once()
         self.after(80, self._drain_ui_queue)
 
     def _append_log(self, text: str) -> None: